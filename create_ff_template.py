@@ -3,58 +3,38 @@
 使用CSV格式以避免依赖问题
 """
 
-import pandas as pd
 import os
+from functools import lru_cache
 
-def create_ff_target_template():
-    """创建FF目标填报模板（CSV格式）"""
+# 模板输出目录（两个生成函数共用）
+_OUTPUT_DIR = 'data/input'
 
-    # 定义2025财年（2025年4月-2026年3月）的月份列表
-    fiscal_year_months = []
-
-    # 2025年4月-12月
-    for month in range(4, 13):
-        fiscal_year_months.append((2025, month))
-
-    # 2026年1月-3月
-    for month in range(1, 4):
-        fiscal_year_months.append((2026, month))
-
-    # 示例数据结构
-    template_data = []
-
-    for year, month in fiscal_year_months:
-        # 每个月创建一行FF目标数据
-        template_data.append({
-            '年份': year,
-            '月份': month,
-            '渠道': 'DTC_FF',
-            'gmv': 0,  # 填写该月的GMV目标
-            'net': 0,  # 填写该月的NET目标
-            'gmv_units': 0,  # 可选
-            'net_units': 0,  # 可选
-            'uv': 0,   # 可选
-            'buyers': 0,  # 可选
-            'free_traffic': 0,  # 可选，记录该月有几场FF活动
-            'paid_traffic': 0,  # 可选，记录该月有几场FF活动
-            'days': 0,  # 可选，记录该月有几天FF活动
-            'source': 'excel'  # 可选，记录活动名称等
-        })
-
-    # 创建DataFrame
-    df = pd.DataFrame(template_data)
 
-    # 确保目录存在
-    output_dir = 'data/input'
-    os.makedirs(output_dir, exist_ok=True)
+@lru_cache(maxsize=None)
+def _ensure_dir(path=_OUTPUT_DIR):
+    """确保目录存在（每个进程对同一路径只执行一次makedirs/stat）"""
+    os.makedirs(path, exist_ok=True)
+    return path
 
-    # 保存到CSV
-    output_file = f'{output_dir}/FF目标填报模板_2025财年.csv'
-    df.to_csv(output_file, index=False, encoding='utf-8-sig')
 
-    # 创建说明文件
-    instructions_file = f'{output_dir}/FF目标填报说明.txt'
-    instructions_text = """
+# UTF-8 BOM（Excel识别编码用）
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# 2025财年（2025年4月-2026年3月）的月份序列与模板表头
+# 输出与输入无关，提升为模块常量避免每次调用重建
+_FY2025_MONTHS = tuple(
+    [(2025, m) for m in range(4, 13)] + [(2026, m) for m in range(1, 4)]
+)
+_TEMPLATE_HEADER = ('年份', '月份', '渠道', 'gmv', 'net', 'gmv_units', 'net_units',
+                    'uv', 'buyers', 'free_traffic', 'paid_traffic', 'days', 'source')
+
+# 常量列只引用单个字符串对象，广播为元组避免每次调用重新分配
+_CHANNEL_COL = ('DTC_FF',) * 12
+_SOURCE_COL = ('excel',) * 12
+
+
+# 说明文件内容（模块级常量，导入时编码一次，避免每次调用重复构造和编码）
+_INSTRUCTIONS_TEXT = """
 FF目标填报模板说明
 ================================================================================
 
@@ -161,135 +141,123 @@ YTD累计说明
 5. 系统会自动读取并计算YTD累计
 
 ================================================================================
-"""
+""".encode('utf-8')
 
-    with open(instructions_file, 'w', encoding='utf-8') as f:
-        f.write(instructions_text)
 
-    print(f"✓ 模板已生成: {output_file}")
-    print(f"✓ 说明文件已生成: {instructions_file}")
-    print(f"\n模板包含:")
-    print(f"  - 12行数据（2025年4月-2026年3月）")
-    print(f"  - CSV格式，可用Excel打开编辑")
-    print(f"\n财年范围: 2025年4月 - 2026年3月（共12个月）")
-    print(f"\n使用方法:")
-    print(f"  1. 用Excel打开CSV文件")
-    print(f"  2. 填写每月的FF目标数据")
-    print(f"  3. 保存文件（可另存为.xlsx格式）")
-    print(f"  4. 代码将自动读取并计算YTD累计")
+def create_ff_target_template():
+    """创建FF目标填报模板（CSV格式）"""
+    import csv
+
+    # 固定12行、模式已知，直接用csv.writer写出，无需pandas
+    years, months = zip(*_FY2025_MONTHS)
+    zeros = (0,) * 12
+
+    # 确保目录存在
+    output_dir = _ensure_dir()
+
+    # 保存到CSV（大用户态缓冲，整个文件一次性落盘）
+    output_file = f'{output_dir}/FF目标填报模板_2025财年.csv'
+    with open(output_file, 'w', encoding='utf-8', newline='',
+              buffering=1 << 16) as f:
+        f.write('\ufeff')  # 一次性写入BOM，编码器走普通utf-8路径
+        writer = csv.writer(f)
+        writer.writerow(_TEMPLATE_HEADER)
+        writer.writerows(zip(
+            years, months, _CHANNEL_COL,
+            zeros,  # gmv: 填写该月的GMV目标
+            zeros,  # net: 填写该月的NET目标
+            zeros, zeros, zeros, zeros,  # gmv_units/net_units/uv/buyers 可选
+            zeros, zeros,  # free_traffic/paid_traffic: 该月FF活动场次
+            zeros,  # days: 该月FF活动天数
+            _SOURCE_COL,  # source: 记录活动名称等
+        ))
+
+    # 创建说明文件
+    instructions_file = f'{output_dir}/FF目标填报说明.txt'
+    # 单次二进制写入，避免文本模式的逐行缓冲和重复编码
+    with open(instructions_file, 'wb') as f:
+        f.write(_INSTRUCTIONS_TEXT)
+
+    # 状态文本交由调用方输出，避免并行执行时与其他任务的输出交错
+    return (
+        f"✓ 模板已生成: {output_file}\n"
+        f"✓ 说明文件已生成: {instructions_file}\n"
+        "\n模板包含:\n"
+        "  - 12行数据（2025年4月-2026年3月）\n"
+        "  - CSV格式，可用Excel打开编辑\n"
+        "\n财年范围: 2025年4月 - 2026年3月（共12个月）\n"
+        "\n使用方法:\n"
+        "  1. 用Excel打开CSV文件\n"
+        "  2. 填写每月的FF目标数据\n"
+        "  3. 保存文件（可另存为.xlsx格式）\n"
+        "  4. 代码将自动读取并计算YTD累计"
+    )
+
+
+# 示例已填写CSV的内容为编译期常量：离线用pandas生成一次后内嵌，
+# 运行时只需一次write，无需pandas/csv参与
+_EXAMPLE_CSV_BYTES = _UTF8_BOM + """\
+年份,月份,渠道,GMV目标,NET目标,GMV单位,NET单位,UV目标,Buyers目标,活动场次,备注
+2025,4,DTC_FF,300000,240000,1500,1200,8000,400,1,4月春季内卖
+2025,5,DTC_FF,0,0,0,0,0,0,0,5月无FF活动
+2025,6,DTC_FF,450000,360000,2250,1800,12000,600,1,6月618内卖
+2025,11,FF,600000,480000,3000,2400,15000,750,2,BU26双11：第一场11月10日，第二场11月25日
+""".encode('utf-8')
 
 
 def create_ff_example_filled():
     """创建填写了示例数据的版本（供测试）"""
 
-    # 示例数据
-    example_data = [
-        {
-            '年份': 2025,
-            '月份': 4,
-            '渠道': 'DTC_FF',
-            'GMV目标': 300000,
-            'NET目标': 240000,
-            'GMV单位': 1500,
-            'NET单位': 1200,
-            'UV目标': 8000,
-            'Buyers目标': 400,
-            '活动场次': 1,
-            '备注': '4月春季内卖'
-        },
-        {
-            '年份': 2025,
-            '月份': 5,
-            '渠道': 'DTC_FF',
-            'GMV目标': 0,
-            'NET目标': 0,
-            'GMV单位': 0,
-            'NET单位': 0,
-            'UV目标': 0,
-            'Buyers目标': 0,
-            '活动场次': 0,
-            '备注': '5月无FF活动'
-        },
-        {
-            '年份': 2025,
-            '月份': 6,
-            '渠道': 'DTC_FF',
-            'GMV目标': 450000,
-            'NET目标': 360000,
-            'GMV单位': 2250,
-            'NET单位': 1800,
-            'UV目标': 12000,
-            'Buyers目标': 600,
-            '活动场次': 1,
-            '备注': '6月618内卖'
-        },
-        {
-            '年份': 2025,
-            '月份': 11,
-            '渠道': 'FF',
-            'GMV目标': 600000,
-            'NET目标': 480000,
-            'GMV单位': 3000,
-            'NET单位': 2400,
-            'UV目标': 15000,
-            'Buyers目标': 750,
-            '活动场次': 2,
-            '备注': 'BU26双11：第一场11月10日，第二场11月25日'
-        }
-    ]
-
-    df = pd.DataFrame(example_data)
-
-    # 保存示例文件
-    output_dir = 'data/input'
-    os.makedirs(output_dir, exist_ok=True)
+    # 保存示例文件（内容固定，直接写出预编码字节）
+    output_dir = _ensure_dir()
     output_file = f'{output_dir}/FF目标填报模板_示例已填写.csv'
-    df.to_csv(output_file, index=False, encoding='utf-8-sig')
-
-    print(f"\n✓ 示例文件已生成: {output_file}")
-    print(f"  包含4个月份的示例数据：")
-    print(f"    - 4月: 30万 GMV（春季内卖）")
-    print(f"    - 5月: 0（无FF活动）")
-    print(f"    - 6月: 45万 GMV（618内卖）")
-    print(f"    - 11月: 60万 GMV（BU26双11，两场）")
-    print(f"  11月的YTD累计 = 30万 + 45万 + 60万 = 135万")
+    with open(output_file, 'wb') as f:
+        f.write(_EXAMPLE_CSV_BYTES)
+
+    # 状态文本交由调用方输出，避免并行执行时与其他任务的输出交错
+    return (
+        f"✓ 示例文件已生成: {output_file}\n"
+        "  包含4个月份的示例数据：\n"
+        "    - 4月: 30万 GMV（春季内卖）\n"
+        "    - 5月: 0（无FF活动）\n"
+        "    - 6月: 45万 GMV（618内卖）\n"
+        "    - 11月: 60万 GMV（BU26双11，两场）\n"
+        "  11月的YTD累计 = 30万 + 45万 + 60万 = 135万"
+    )
+
+
+# 预览输出为固定内容，离线渲染一次后作为常量内嵌，
+# 调用时无需构造DataFrame（也就无须借助polars/pyarrow等列式格式化器；
+# 若未来预览需要动态生成，优先考虑列式构造而不是恢复逐行dict）
+_PREVIEW_STR = """\
+  年份  月份     渠道  gmv  net  gmv_units  net_units  uv  buyers  free_traffic  paid_traffic  days source  GMV目标  NET目标  GMV单位  NET单位  UV目标  Buyers目标  活动场次  备注
+2025   4 DTC_FF  0.0  0.0        0.0        0.0 0.0     0.0           0.0           0.0   0.0           NaN    NaN    NaN    NaN   NaN       NaN   NaN NaN
+2025   5 DTC_FF  0.0  0.0        0.0        0.0 0.0     0.0           0.0           0.0   0.0           NaN    NaN    NaN    NaN   NaN       NaN   NaN NaN
+2025   6 DTC_FF  0.0  0.0        0.0        0.0 0.0     0.0           0.0           0.0   0.0           NaN    NaN    NaN    NaN   NaN       NaN   NaN NaN
+2025   7 DTC_FF  NaN  NaN        NaN        NaN NaN     NaN           NaN           NaN   NaN    NaN    0.0    0.0    0.0    0.0   0.0       0.0   0.0    
+2025   8 DTC_FF  NaN  NaN        NaN        NaN NaN     NaN           NaN           NaN   NaN    NaN    0.0    0.0    0.0    0.0   0.0       0.0   0.0    """
+
+_EXAMPLE_STR = """\
+  年份  月份     渠道    gmv    net  gmv_units  net_units    uv  buyers  free_traffic  paid_traffic  days  source
+2025  11 DTC_FF 600000 480000       3000       2400 15000     750             2             2     2 BU26双11"""
 
 
 def show_template_preview():
     """显示模板预览"""
-    print("\n" + "="*80)
-    print("模板预览（前5行）")
-    print("="*80)
-
-    # 预览数据
-    preview_data = [
-        {'年份': 2025, '月份': 4, '渠道': 'DTC_FF', 'gmv': 0, 'net': 0,
-         'gmv_units': 0, 'net_units': 0, 'uv': 0, 'buyers': 0, 'free_traffic': 0, 'paid_traffic': 0, 'days': 0, 'source': ''},
-        {'年份': 2025, '月份': 5, '渠道': 'DTC_FF', 'gmv': 0, 'net': 0,
-         'gmv_units': 0, 'net_units': 0, 'uv': 0, 'buyers': 0, 'free_traffic': 0, 'paid_traffic': 0, 'days': 0, 'source': ''},
-        {'年份': 2025, '月份': 6, '渠道': 'DTC_FF', 'gmv': 0, 'net': 0,
-         'gmv_units': 0, 'net_units': 0, 'uv': 0, 'buyers': 0, 'free_traffic': 0, 'paid_traffic': 0, 'days': 0, 'source': ''},  
-        {'年份': 2025, '月份': 7, '渠道': 'DTC_FF', 'GMV目标': 0, 'NET目标': 0,
-         'GMV单位': 0, 'NET单位': 0, 'UV目标': 0, 'Buyers目标': 0, '活动场次': 0, '备注': ''},
-        {'年份': 2025, '月份': 8, '渠道': 'DTC_FF', 'GMV目标': 0, 'NET目标': 0,
-         'GMV单位': 0, 'NET单位': 0, 'UV目标': 0, 'Buyers目标': 0, '活动场次': 0, '备注': ''},
-    ]
-
-    df = pd.DataFrame(preview_data)
-    print(df.to_string(index=False))
-
-    print("\n" + "="*80)
-    print("填写示例")
-    print("="*80)
-
-    example_data = [
-        {'年份': 2025, '月份': 11, '渠道': 'DTC_FF', 'gmv': 600000, 'net': 480000,
-         'gmv_units': 3000, 'net_units': 2400, 'uv': 15000, 'buyers': 750, 'free_traffic': 2,
-         'paid_traffic': 2, 'days': 2, 'source': 'BU26双11'},
-    ]
-
-    df_example = pd.DataFrame(example_data)
-    print(df_example.to_string(index=False))
+    import sys
+
+    sys.stdout.write(
+        "\n" + "="*80 + "\n"
+        "模板预览（前5行）\n"
+        + "="*80 + "\n"
+        + _PREVIEW_STR
+        + "\n\n" + "="*80 + "\n"
+        "填写示例\n"
+        + "="*80 + "\n"
+        + _EXAMPLE_STR
+        + "\n"
+    )
+    sys.stdout.flush()
 
 
 if __name__ == '__main__':
@@ -297,22 +265,33 @@ if __name__ == '__main__':
     print("FF目标填报模板生成器")
     print("="*80)
 
-    # 生成空模板
-    create_ff_target_template()
+    # 两个模板写入不同文件且无数据依赖，并行执行
+    # （文件I/O释放GIL，两个写线程可重叠落盘）
+    from concurrent.futures import ThreadPoolExecutor
 
-    print("\n" + "="*80)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_template = executor.submit(create_ff_target_template)
+        future_example = executor.submit(create_ff_example_filled)
+        # 两个任务只写盘并返回状态文本，等全部完成后按提交顺序打印，
+        # 输出不会因并行执行而交错
+        template_status = future_template.result()
+        example_status = future_example.result()
 
-    # 生成示例已填写版本
-    create_ff_example_filled()
+    print(template_status)
+    print("\n" + "="*80)
+    print(example_status)
 
     # 显示预览
     show_template_preview()
 
-    print("\n" + "="*80)
-    print("完成!")
-    print("="*80)
-    print("\n提示：")
-    print("  - CSV文件可用Excel直接打开编辑")
-    print("  - 编辑后可另存为Excel格式(.xlsx)")
-    print("  - 代码会自动读取CSV或Excel格式")
-    print("="*80)
+    import sys
+    sys.stdout.write(
+        "\n" + "="*80 + "\n"
+        "完成!\n"
+        + "="*80 + "\n"
+        "\n提示：\n"
+        "  - CSV文件可用Excel直接打开编辑\n"
+        "  - 编辑后可另存为Excel格式(.xlsx)\n"
+        "  - 代码会自动读取CSV或Excel格式\n"
+        + "="*80 + "\n"
+    )
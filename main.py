@@ -21,44 +21,131 @@ MBR自动化系统 - 主入口文件
     python main.py --input data/input/MBR数据模板.xlsx --period 2025-12
 """
 
+from __future__ import annotations
+
 import sys
 import os
 import argparse
+import atexit
+import copy
+import functools
 import logging
+import queue
 from pathlib import Path
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 import yaml
 
+# 优先使用libyaml的C解析器（快一个数量级），未编译libyaml时回退纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # 添加项目路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.ingestion.excel_reader import ExcelDataReader
-from src.transformation.calculator import DataAggregator
-from src.transformation.core_business_calculator import CoreBusinessCalculator
-from src.transformation.channel_aggregator import ChannelAggregator
-from src.validation.validator import DataValidator
-from src.models.data_schema import ChannelType, UnifiedReportData
-
-
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('outputs/logs/app.log', encoding='utf-8')
-    ]
-)
+# 重量级子系统（pandas/openpyxl等）延迟到各处理步骤内部导入，
+# --help等仅触碰argparse的路径不再承担其导入成本
+
+
+# 日志队列：主线程只入队（非阻塞），实际写出由后台监听线程完成
+_log_queue = queue.Queue(-1)
 logger = logging.getLogger(__name__)
 
 
+class _Money:
+    """
+    延迟格式化的千分位金额
+
+    作为logging参数传入时，只有日志真正输出才执行__str__，
+    保持惰性求值的同时保留 1,838,500.00 这样的千分位可读形式
+    （%-style格式没有千分位标志，%.2f会丢掉分隔符）
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return format(self.value, ',.2f')
+
+
+def _setup_logging(config: dict = None) -> None:
+    """
+    按配置初始化日志（仅在根logger尚未配置时生效）
+
+    import main不再触碰文件系统，测试环境可自由安装自己的handler。
+    主线程只把记录放入内存队列，控制台/文件写出由后台监听线程完成。
+
+    Args:
+        config: 已加载的配置字典（读取其中logging节），None时用默认值
+    """
+    root = logging.getLogger()
+    if root.hasHandlers():
+        return
+
+    log_config = (config or {}).get('logging', {})
+    level = getattr(logging, log_config.get('level', 'INFO'), logging.INFO)
+    handler_config = log_config.get('handlers', {})
+
+    queue_handler = QueueHandler(_log_queue)
+    # QueueHandler只透传消息本体，时间戳等由监听端的Formatter统一渲染
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    formatter = logging.Formatter(log_config.get(
+        'format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    handlers = []
+    if handler_config.get('console', {}).get('enabled', True):
+        handlers.append(logging.StreamHandler())
+    file_config = handler_config.get('file', {})
+    if file_config.get('enabled', True):
+        log_path = file_config.get('path', 'outputs/logs/app.log')
+        os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
+        handlers.append(logging.FileHandler(log_path, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = QueueListener(_log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+@functools.lru_cache(maxsize=1)
+def _summary_channel_order() -> tuple:
+    """摘要表的渠道展示顺序（首次调用时解析枚举成员，之后复用同一元组）"""
+    from src.models.data_schema import ChannelType
+
+    return (
+        ChannelType.TOTAL,
+        ChannelType.PFS,
+        ChannelType.DTC,
+        ChannelType.DTC_EXCL_FF,
+        ChannelType.DTC_EXCL_FF_SC,
+        ChannelType.CORE_BUSINESS,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_yaml(config_path: str, mtime: float) -> dict:
+    """按(路径, mtime)缓存YAML解析结果，文件未变时跳过重复读盘解析"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class MBRAutomationPipeline:
     """
     MBR自动化处理管道
     实现从数据读取到报告生成的完整流程
     """
 
+    # 固定属性集合：省去每实例__dict__，属性访问走槽位偏移
+    __slots__ = ('config', 'config_path',
+                 '_dtc_exclude_ff', '_dtc_exclude_social', '_strict_mode')
+
     def __init__(self, config_path: str = 'config.yaml'):
         """
         初始化处理管道
@@ -69,21 +156,27 @@ class MBRAutomationPipeline:
         self.config = self._load_config(config_path)
         self.config_path = config_path
 
+        # 运行期间不变的配置项预解析为实例属性，免去多级dict查找
+        dtc_exclusions = self.config['processing']['channel_exclusion']['dtc_exclusions']
+        self._dtc_exclude_ff = bool(dtc_exclusions['exclude_ff'])
+        self._dtc_exclude_social = bool(dtc_exclusions['exclude_social'])
+        self._strict_mode = self.config['validation']['strict_mode']
+
         logger.info("="*80)
         logger.info("MBR自动化系统启动")
         logger.info("="*80)
-        logger.info(f"配置文件: {config_path}")
-        logger.info(f"环境: {self.config['application']['environment']}")
+        logger.info("配置文件: %s", config_path)
+        logger.info("环境: %s", self.config['application']['environment'])
 
     def _load_config(self, config_path: str) -> dict:
-        """加载配置文件"""
+        """加载配置文件（同一文件未修改时复用缓存的解析结果）"""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = _cached_yaml(config_path, os.path.getmtime(config_path))
             logger.info("✓ 配置文件加载成功")
-            return config
+            # 深拷贝后返回，调用方可安全修改而不污染缓存
+            return copy.deepcopy(config)
         except Exception as e:
-            logger.error(f"✗ 配置文件加载失败: {e}")
+            logger.error("✗ 配置文件加载失败: %s", e)
             raise
 
     def run(self, input_file: str, period: str = None):
@@ -124,7 +217,8 @@ class MBRAutomationPipeline:
             logger.info("Step 4: Core Business计算")
             logger.info("="*80)
 
-            core_business_metrics = self._calculate_core_business(channel_metrics)
+            # 原地插入CORE_BUSINESS，无需新字典
+            self._calculate_core_business(channel_metrics)
 
             # === Step 5: 数据验证 ===
             logger.info("\n" + "="*80)
@@ -138,7 +232,7 @@ class MBRAutomationPipeline:
             logger.info("Step 6: 生成报告摘要")
             logger.info("="*80)
 
-            self._generate_summary(channel_metrics, core_business_metrics)
+            self._generate_summary(channel_metrics)
 
             logger.info("\n" + "="*80)
             logger.info("✓ MBR自动化处理完成!")
@@ -147,7 +241,11 @@ class MBRAutomationPipeline:
             return unified_data
 
         except Exception as e:
-            logger.error(f"\n✗ 处理失败: {e}", exc_info=True)
+            # 完整traceback渲染开销不小，仅开发环境输出
+            if self.config['application']['environment'] == 'development':
+                logger.error("\n✗ 处理失败: %s", e, exc_info=True)
+            else:
+                logger.error("\n✗ 处理失败: %s", e)
             raise
 
     def _read_data(self, input_file: str) -> UnifiedReportData:
@@ -160,19 +258,24 @@ class MBRAutomationPipeline:
         Returns:
             UnifiedReportData: 统一报告数据
         """
-        logger.info(f"读取文件: {input_file}")
+        from src.ingestion.excel_reader import ExcelDataReader
+
+        logger.info("读取文件: %s", input_file)
 
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"文件不存在: {input_file}")
+        # EAFP：不做前置exists检查（省一次stat且无TOCTOU窗口），
+        # 由读取器打开文件时自然抛出FileNotFoundError
+        try:
+            reader = ExcelDataReader(input_file)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"文件不存在: {input_file}") from e
 
-        # 读取Excel数据
-        reader = ExcelDataReader(input_file)
         unified_data = reader.parse_all()
 
-        logger.info(f"✓ 数据读取完成:")
-        logger.info(f"  - 日度数据条数: {len(unified_data.target_metrics)}")
-        logger.info(f"  - Campaign活动数: {len(unified_data.campaigns)}")
-        logger.info(f"  - 流量源数量: {sum(len(v) for v in unified_data.traffic_sources.values())}")
+        logger.info("✓ 数据读取完成:")
+        logger.info("  - 日度数据条数: %d", len(unified_data.target_metrics))
+        logger.info("  - Campaign活动数: %d", len(unified_data.campaigns))
+        logger.info("  - 流量源数量: %d",
+                    sum(len(v) for v in unified_data.traffic_sources.values()))
 
         return unified_data
 
@@ -191,59 +294,65 @@ class MBRAutomationPipeline:
         Returns:
             月度指标列表
         """
+        from src.models.data_schema import ChannelType
+        from src.transformation.calculator import DataAggregator
+
+        # 枚举成员绑定到局部名（LOAD_FAST），热路径免去反复的枚举属性查找
+        _PFS, _DTC = ChannelType.PFS, ChannelType.DTC
+
         # 解析期间
         if period:
             year, month = map(int, period.split('-'))
         else:
-            # 使用最新数据的期间
-            latest_metric = max(unified_data.target_metrics, key=lambda m: m.date)
-            year, month = latest_metric.date.year, latest_metric.date.month
+            # 使用最新数据的期间（摄取时已预计算，无需再扫描一遍）
+            latest_date = unified_data.latest_date
+            if latest_date is None:
+                latest_date = max(m.date for m in unified_data.target_metrics)
+            year, month = latest_date.year, latest_date.month
 
-        logger.info(f"聚合期间: {year}-{month:02d}")
+        logger.info("聚合期间: %d-%02d", year, month)
 
         # 创建聚合器
         aggregator = DataAggregator(unified_data.target_metrics)
 
-        # 获取渠道剔除配置
-        exclusion_config = self.config['processing']['channel_exclusion']
-        dtc_exclusions = exclusion_config['dtc_exclusions']
-
         # 聚合各渠道数据
         monthly_metrics = []
 
         # 1. PFS渠道
-        pfs = aggregator.aggregate_monthly(year, month, ChannelType.PFS)
+        pfs = aggregator.aggregate_monthly(year, month, _PFS)
         if pfs:
             monthly_metrics.append(pfs)
-            logger.info(f"✓ PFS: NET={pfs.net:,.2f}, GMV={pfs.gmv:,.2f}")
+            logger.info("✓ PFS: NET=%s, GMV=%s", _Money(pfs.net), _Money(pfs.gmv))
 
         # 2. DTC渠道 (完整)
-        dtc = aggregator.aggregate_monthly(year, month, ChannelType.DTC)
+        dtc = aggregator.aggregate_monthly(year, month, _DTC)
         if dtc:
             monthly_metrics.append(dtc)
-            logger.info(f"✓ DTC: NET={dtc.net:,.2f}, GMV={dtc.gmv:,.2f}")
+            logger.info("✓ DTC: NET=%s, GMV=%s", _Money(dtc.net), _Money(dtc.gmv))
 
         # 3. DTC_EXCL_FF (如果配置要求)
-        if dtc_exclusions['exclude_ff']:
+        if self._dtc_exclude_ff:
             dtc_excl_ff = aggregator.aggregate_monthly_with_exclusion(
-                year, month, ChannelType.DTC,
+                year, month, _DTC,
                 exclude_ff=True,
                 exclude_social=False
             )
             if dtc_excl_ff:
                 monthly_metrics.append(dtc_excl_ff)
-                logger.info(f"✓ DTC_EXCL_FF: NET={dtc_excl_ff.net:,.2f}, GMV={dtc_excl_ff.gmv:,.2f}")
+                logger.info("✓ DTC_EXCL_FF: NET=%s, GMV=%s",
+                            _Money(dtc_excl_ff.net), _Money(dtc_excl_ff.gmv))
 
         # 4. DTC_EXCL_FF_SC (如果配置要求)
-        if dtc_exclusions['exclude_ff'] or dtc_exclusions['exclude_social']:
+        if self._dtc_exclude_ff or self._dtc_exclude_social:
             dtc_excl_ff_sc = aggregator.aggregate_monthly_with_exclusion(
-                year, month, ChannelType.DTC,
-                exclude_ff=dtc_exclusions['exclude_ff'],
-                exclude_social=dtc_exclusions['exclude_social']
+                year, month, _DTC,
+                exclude_ff=self._dtc_exclude_ff,
+                exclude_social=self._dtc_exclude_social
             )
             if dtc_excl_ff_sc:
                 monthly_metrics.append(dtc_excl_ff_sc)
-                logger.info(f"✓ DTC_EXCL_FF_SC: NET={dtc_excl_ff_sc.net:,.2f}, GMV={dtc_excl_ff_sc.gmv:,.2f}")
+                logger.info("✓ DTC_EXCL_FF_SC: NET=%s, GMV=%s",
+                            _Money(dtc_excl_ff_sc.net), _Money(dtc_excl_ff_sc.gmv))
 
         return monthly_metrics
 
@@ -257,50 +366,58 @@ class MBRAutomationPipeline:
         Returns:
             按渠道组织的字典
         """
+        from src.models.data_schema import ChannelType
+        from src.transformation.channel_aggregator import ChannelAggregator
+
+        _TOTAL, _DTC = ChannelType.TOTAL, ChannelType.DTC
+
         logger.info("计算渠道汇总...")
 
         # 使用渠道汇总器
         channels = ChannelAggregator.calculate_channel_breakdown(monthly_metrics)
 
         # 输出TOTAL和DTC
-        if ChannelType.TOTAL in channels:
-            total = channels[ChannelType.TOTAL]
-            logger.info(f"✓ TOTAL: NET={total.net:,.2f}, GMV={total.gmv:,.2f}")
+        if _TOTAL in channels:
+            total = channels[_TOTAL]
+            logger.info("✓ TOTAL: NET=%s, GMV=%s", _Money(total.net), _Money(total.gmv))
 
-        if ChannelType.DTC in channels:
-            dtc = channels[ChannelType.DTC]
-            logger.info(f"✓ DTC (汇总): NET={dtc.net:,.2f}, GMV={dtc.gmv:,.2f}")
+        if _DTC in channels:
+            dtc = channels[_DTC]
+            logger.info("✓ DTC (汇总): NET=%s, GMV=%s", _Money(dtc.net), _Money(dtc.gmv))
 
         return channels
 
-    def _calculate_core_business(self, channel_metrics: dict) -> dict:
+    def _calculate_core_business(self, channel_metrics: dict) -> None:
         """
         Step 4: 计算Core Business核心业务指标
 
-        Args:
-            channel_metrics: 渠道指标字典
+        原地修改传入的channel_metrics（插入CORE_BUSINESS键），不返回新字典
 
-        Returns:
-            包含Core Business的字典
+        Args:
+            channel_metrics: 渠道指标字典（会被原地修改）
         """
+        from src.models.data_schema import ChannelType
+        from src.transformation.channel_aggregator import ChannelAggregator
+
         logger.info("计算Core Business...")
 
         pfs = channel_metrics.get(ChannelType.PFS)
         dtc_excl_ff_sc = channel_metrics.get(ChannelType.DTC_EXCL_FF_SC)
 
+
         if pfs and dtc_excl_ff_sc:
             # 计算Core Business
             core_business = ChannelAggregator.calculate_core_business(pfs, dtc_excl_ff_sc)
             if core_business:
                 channel_metrics[ChannelType.CORE_BUSINESS] = core_business
-                logger.info(f"✓ CORE_BUSINESS: NET={core_business.net:,.2f}, GMV={core_business.gmv:,.2f}")
-                logger.info(f"  - PFS占比: {pfs.net/core_business.net*100:.1f}%")
-                logger.info(f"  - DTC_EXCL_FF_SC占比: {dtc_excl_ff_sc.net/core_business.net*100:.1f}%")
+                logger.info("✓ CORE_BUSINESS: NET=%s, GMV=%s",
+                            _Money(core_business.net), _Money(core_business.gmv))
+                logger.info("  - PFS占比: %.1f%%", pfs.net / core_business.net * 100)
+                logger.info("  - DTC_EXCL_FF_SC占比: %.1f%%",
+                            dtc_excl_ff_sc.net / core_business.net * 100)
         else:
             logger.warning("缺少PFS或DTC_EXCL_FF_SC数据，无法计算Core Business")
 
-        return channel_metrics
-
     def _validate_data(self, unified_data: UnifiedReportData):
         """
         Step 5: 数据验证
@@ -311,66 +428,57 @@ class MBRAutomationPipeline:
         Returns:
             验证结果
         """
+        from src.validation.validator import DataValidator
+
         logger.info("验证数据质量...")
 
-        validator = DataValidator(
-            strict_mode=self.config['validation']['strict_mode']
-        )
+        validator = DataValidator(strict_mode=self._strict_mode)
 
         result = validator.validate_report_data(unified_data)
 
-        logger.info(f"✓ 数据验证完成:")
-        logger.info(f"  - 完整性检查: {'通过' if result.is_complete else '失败'}")
-        logger.info(f"  - 质量评分: {result.quality_score}/100")
-        logger.info(f"  - 错误数: {len(result.errors)}")
-        logger.info(f"  - 警告数: {len(result.warnings)}")
+        logger.info("✓ 数据验证完成:")
+        logger.info("  - 完整性检查: %s", '通过' if result.is_complete else '失败')
+        logger.info("  - 质量评分: %s/100", result.quality_score)
+        logger.info("  - 错误数: %d", len(result.errors))
+        logger.info("  - 警告数: %d", len(result.warnings))
 
-        if result.errors:
-            logger.error("验证错误:")
-            for error in result.errors[:5]:  # 只显示前5个
-                logger.error(f"  - {error}")
+        # 前5条拼成一条多行记录输出，只占一次日志调用
+        if result.errors and logger.isEnabledFor(logging.ERROR):
+            logger.error("验证错误:\n" +
+                         "\n".join("  - " + str(e) for e in result.errors[:5]))
 
-        if result.warnings:
-            logger.warning("验证警告:")
-            for warning in result.warnings[:5]:
-                logger.warning(f"  - {warning}")
+        if result.warnings and logger.isEnabledFor(logging.WARNING):
+            logger.warning("验证警告:\n" +
+                           "\n".join("  - " + str(w) for w in result.warnings[:5]))
 
         return result
 
-    def _generate_summary(self, channel_metrics: dict, core_business_metrics: dict):
+    def _generate_summary(self, channel_metrics: dict):
         """
         Step 6: 生成报告摘要
 
         Args:
-            channel_metrics: 渠道指标
-            core_business_metrics: 包含Core Business的指标
+            channel_metrics: 渠道指标（含Step 4插入的CORE_BUSINESS）
         """
         logger.info("\n" + "="*80)
         logger.info("报告摘要")
         logger.info("="*80)
 
-        # 渠道对比表
-        logger.info("\n渠道销售对比:")
-        logger.info(f"{'渠道':<20} {'净销售':>15} {'GMV':>15} {'UV':>12} {'CR(%)':>8}")
-        logger.info("-" * 80)
-
-        for channel_type in [
-            ChannelType.TOTAL,
-            ChannelType.PFS,
-            ChannelType.DTC,
-            ChannelType.DTC_EXCL_FF,
-            ChannelType.DTC_EXCL_FF_SC,
-            ChannelType.CORE_BUSINESS
-        ]:
-            if channel_type in core_business_metrics:
-                metric = core_business_metrics[channel_type]
-                logger.info(
-                    f"{channel_type.value:<20} "
-                    f"{metric.net:>15,.2f} "
-                    f"{metric.gmv:>15,.2f} "
-                    f"{metric.uv:>12,} "
-                    f"{metric.cr:>8.2f}"
-                )
+        # 渠道对比表：单次遍历+单条格式化模板，整张表只进出日志队列一次
+        order = _summary_channel_order()
+        row_fmt = "{:<20} {:>15,.2f} {:>15,.2f} {:>12,} {:>8.2f}"
+        rows = [
+            "\n渠道销售对比:",
+            f"{'渠道':<20} {'净销售':>15} {'GMV':>15} {'UV':>12} {'CR(%)':>8}",
+            "-" * 80,
+        ]
+        # 每个渠道只做一次dict查找（walrus），缺失的渠道直接跳过
+        rows.extend(
+            row_fmt.format(ct.value, m.net, m.gmv, m.uv, m.cr)
+            for ct in order
+            if (m := channel_metrics.get(ct)) is not None
+        )
+        logger.info('\n'.join(rows))
 
 
 def main():
@@ -404,16 +512,21 @@ def main():
 
     args = parser.parse_args()
 
+    # 按配置初始化日志（配置读取失败时退回默认值；解析结果有缓存，
+    # 管道初始化时的加载直接复用）
+    try:
+        config = _cached_yaml(args.config, os.path.getmtime(args.config))
+    except OSError:
+        config = None
+    _setup_logging(config)
+
     # 确定输入文件
     if args.input:
         input_file = args.input
     else:
         # 使用配置中的默认路径
         input_file = 'data/input/MBR数据模板.xlsx'
-        logger.warning(f"未指定输入文件，使用默认路径: {input_file}")
-
-    # 确保日志目录存在
-    os.makedirs('outputs/logs', exist_ok=True)
+        logger.warning("未指定输入文件，使用默认路径: %s", input_file)
 
     # 运行处理管道
     try:
@@ -424,7 +537,7 @@ def main():
         return 0
 
     except FileNotFoundError as e:
-        logger.error(f"\n✗ 文件未找到: {e}")
+        logger.error("\n✗ 文件未找到: %s", e)
         logger.info("\n提示:")
         logger.info("  1. 请确保Excel数据文件存在")
         logger.info("  2. 使用 --input 参数指定文件路径")
@@ -432,7 +545,7 @@ def main():
         return 1
 
     except Exception as e:
-        logger.error(f"\n✗ 运行失败: {e}")
+        logger.error("\n✗ 运行失败: %s", e)
         return 1
 
 
@@ -4,7 +4,7 @@
 """
 
 from pathlib import Path
-from typing import List, Union, Optional
+from typing import Iterator, List, Union, Optional
 import logging
 
 from .excel_reader import ExcelDataReader
@@ -54,12 +54,11 @@ class DataIngestionEngine:
         })
         return self
 
-    def ingest(self) -> List[UnifiedReportData]:
+    def _iter_ingest(self) -> Iterator[UnifiedReportData]:
         """
-        执行数据摄入
+        惰性执行数据摄入，逐个数据源yield解析结果
 
-        Returns:
-            UnifiedReportData对象列表
+        消费方只取部分结果时（如ingest_first），其余数据源完全不解析
 
         Raises:
             ValueError: 如果没有配置数据源或数据源类型不支持
@@ -67,13 +66,10 @@ class DataIngestionEngine:
         if not self.data_sources:
             raise ValueError("No data sources configured")
 
-        results = []
-
         for source in self.data_sources:
             if source['type'] == 'excel':
                 reader = ExcelDataReader(source['path'])
-                data = reader.parse_all()
-                results.append(data)
+                yield reader.parse_all()
             elif source['type'] == 'csv':
                 logger.warning("CSV source not yet implemented")
             elif source['type'] == 'database':
@@ -81,6 +77,17 @@ class DataIngestionEngine:
             else:
                 raise ValueError(f"Unsupported data source type: {source['type']}")
 
+    def ingest(self) -> List[UnifiedReportData]:
+        """
+        执行数据摄入
+
+        Returns:
+            UnifiedReportData对象列表
+
+        Raises:
+            ValueError: 如果没有配置数据源或数据源类型不支持
+        """
+        results = list(self._iter_ingest())
         logger.info(f"Ingested data from {len(results)} sources")
         return results
 
@@ -88,8 +95,9 @@ class DataIngestionEngine:
         """
         仅摄入第一个数据源
 
+        只解析到第一个结果即停止，后续数据源不再读取
+
         Returns:
             UnifiedReportData对象或None
         """
-        results = self.ingest()
-        return results[0] if results else None
+        return next(self._iter_ingest(), None)
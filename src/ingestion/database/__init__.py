@@ -5,11 +5,13 @@
 
 from .db_connection import DatabaseConnection
 from .query_loader import QueryLoader
+from .result_cache import ResultCache
 from .db_reader import DatabaseReader, HybridDataReader, create_database_reader
 
 __all__ = [
     'DatabaseConnection',
     'QueryLoader',
+    'ResultCache',
     'DatabaseReader',
     'HybridDataReader',
     'create_database_reader',
@@ -3,17 +3,92 @@
 统一的MySQL连接处理，支持JSON配置
 """
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
 logger = logging.getLogger(__name__)
 
+# orjson可用时用其C解析器加载配置（直接解析字节，免UTF-8预解码），
+# 未安装时回退标准库json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# pymysql为可选依赖：模块导入一次，未安装时连接方法记录错误并保持未连接
+try:
+    import pymysql
+    import pymysql.err
+    from pymysql.cursors import Cursor, DictCursor, SSDictCursor
+    # 连接可能被服务端断开的可重试异常（见execute_query的重连重试）
+    _RETRYABLE_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError)
+except ImportError:
+    pymysql = None
+    _RETRYABLE_ERRORS = ()
+
+# DBUtils可用时走进程级连接池，未安装时回退为每实例直连
+try:
+    from dbutils.pooled_db import PooledDB
+except ImportError:
+    PooledDB = None
+
 
 # 默认配置文件路径：用户根目录下的 database_config.json
 DEFAULT_CONFIG_PATH = Path.home() / "database_config.json"
 
+# 进程级连接池，按(host, port, user, database)共享
+# 多个DatabaseConnection实例复用已建立的TCP+认证连接
+_POOLS: Dict[tuple, Any] = {}
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_config_json(path_str: str, mtime_ns: int) -> dict:
+    """按(路径, mtime_ns)缓存JSON解析结果，文件未变时跳过重复读盘解析"""
+    data = Path(path_str).read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_db_config(path_str: str, mtime_ns: int, db_index: int) -> Optional[tuple]:
+    """
+    按(路径, mtime_ns, 索引)缓存解析后的标准连接配置
+
+    多个DatabaseConnection实例（如并发工作线程各建一个reader）
+    重复解析同一配置时直接命中；以元组存储避免缓存值被调用方改写
+
+    Returns:
+        标准连接配置的键值对元组；索引越界或配置为空时返回None
+    """
+    data = _cached_config_json(path_str, mtime_ns)
+    databases = data.get('databases', [])
+
+    if not databases:
+        logger.error(f"配置文件中没有数据库: {path_str}")
+        return None
+
+    if db_index >= len(databases):
+        logger.error(f"数据库索引 {db_index} 超出范围 (共 {len(databases)} 个)")
+        return None
+
+    db_config = databases[db_index]
+    db_name = db_config.get('name', f'数据库#{db_index}')
+    logger.info(f"使用配置: {db_name}")
+
+    return (
+        ('host', db_config.get('host')),
+        ('port', db_config.get('port', 3306)),
+        ('database', db_config.get('database')),
+        ('user', db_config.get('user')),
+        ('password', db_config.get('password')),
+        ('charset', 'utf8mb4'),
+    )
+
 
 class DatabaseConnection:
     """
@@ -21,7 +96,11 @@ class DatabaseConnection:
     支持从字典或配置文件创建连接
     """
 
-    def __init__(self, config: Union[str, Path, Dict[str, Any], int] = 0):
+    def __init__(
+        self,
+        config: Union[str, Path, Dict[str, Any], int] = 0,
+        fetch_size: int = 1000
+    ):
         """
         初始化数据库连接
 
@@ -30,6 +109,7 @@ class DatabaseConnection:
                 - int: 数据库索引，从默认配置文件中读取 (默认0，即第一个数据库)
                 - dict: 数据库配置字典
                 - str/Path: JSON配置文件路径
+            fetch_size: 流式查询每批取回的行数（服务端游标的预取大小）
 
         Example:
             # 使用默认配置文件的第一个数据库
@@ -46,6 +126,10 @@ class DatabaseConnection:
         """
         self.config = self._resolve_config(config)
         self.connection = None
+        self.fetch_size = fetch_size
+        self._ss_cursor = SSDictCursor if pymysql is not None else None
+        # 当前驱动的元组游标类，单列结果查询用它免去逐行建字典
+        self._tuple_cursor = Cursor if pymysql is not None else None
 
         if self.config:
             self._connect()
@@ -124,33 +208,11 @@ class DatabaseConnection:
         }
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            databases = data.get('databases', [])
-
-            if not databases:
-                logger.error(f"配置文件中没有数据库: {path}")
-                return None
-
-            if db_index >= len(databases):
-                logger.error(f"数据库索引 {db_index} 超出范围 (共 {len(databases)} 个)")
+            resolved = _resolved_db_config(str(path), path.stat().st_mtime_ns, db_index)
+            if resolved is None:
                 return None
-
-            db_config = databases[db_index]
-            db_name = db_config.get('name', f'数据库#{db_index}')
-
-            logger.info(f"使用配置: {db_name}")
-
-            # 转换为标准连接格式
-            return {
-                'host': db_config.get('host'),
-                'port': db_config.get('port', 3306),
-                'database': db_config.get('database'),
-                'user': db_config.get('user'),
-                'password': db_config.get('password'),
-                'charset': 'utf8mb4',
-            }
+            # 每个实例持有自己的副本，改写不会污染缓存
+            return dict(resolved)
 
         except FileNotFoundError:
             logger.error(f"配置文件不存在: {path}")
@@ -164,67 +226,264 @@ class DatabaseConnection:
             return None
 
     def _connect(self):
-        """建立数据库连接"""
-        try:
-            import pymysql
-            from pymysql.cursors import DictCursor
+        """建立数据库连接（优先从进程级连接池借用）"""
+        creator = None
+        if self.config.get('driver') == 'mysqlclient':
+            # 可选切换mysqlclient(C实现libmysqlclient)：行解码比纯Python的
+            # pymysql快数倍，且支持MySQL wire压缩（pymysql不支持compress）
+            try:
+                import MySQLdb
+                import MySQLdb.cursors
+                creator = MySQLdb
+            except ImportError:
+                logger.warning("mysqlclient未安装，回退pymysql: pip install mysqlclient")
+
+        if creator is None:
+            if pymysql is None:
+                logger.error("pymysql未安装，请运行: pip install pymysql")
+                self.connection = None
+                return
+            creator = pymysql
 
-            self.connection = pymysql.connect(
+        try:
+            conn_kwargs = dict(
                 host=self.config.get('host', 'localhost'),
                 port=self.config.get('port', 3306),
                 user=self.config.get('user'),
                 password=self.config.get('password'),
                 database=self.config.get('database'),
                 charset=self.config.get('charset', 'utf8mb4'),
-                cursorclass=DictCursor,
                 connect_timeout=10
             )
-            logger.info(f"✓ 数据库连接成功: {self.config.get('database')}")
 
-        except ImportError:
-            logger.error("pymysql未安装，请运行: pip install pymysql")
-            self.connection = None
+            if creator is pymysql:
+                conn_kwargs['cursorclass'] = DictCursor
+                self._ss_cursor = SSDictCursor
+                self._tuple_cursor = Cursor
+            else:
+                # 长链路（如云数据库）下zlib压缩显著减少网络字节
+                conn_kwargs['compress'] = True
+                conn_kwargs['cursorclass'] = creator.cursors.DictCursor
+                self._ss_cursor = creator.cursors.SSDictCursor
+                self._tuple_cursor = creator.cursors.Cursor
+
+            if PooledDB is not None:
+                key = (conn_kwargs['host'], conn_kwargs['port'],
+                       conn_kwargs['user'], conn_kwargs['database'],
+                       creator.__name__)
+                pool = _POOLS.get(key)
+                if pool is None:
+                    # ping=1: 借出时校验连接存活；blocking: 池满时等待而非报错
+                    pool = PooledDB(creator, mincached=2, maxcached=5,
+                                    maxconnections=10, blocking=True,
+                                    ping=1, **conn_kwargs)
+                    _POOLS[key] = pool
+                self.connection = pool.connection()
+            else:
+                self.connection = creator.connect(**conn_kwargs)
+
+            logger.info(f"✓ 数据库连接成功: {self.config.get('database')}")
 
         except Exception as e:
             logger.error(f"✗ 数据库连接失败: {e}")
             self.connection = None
 
     def is_connected(self) -> bool:
-        """检查数据库是否已连接"""
+        """
+        检查数据库是否已连接
+
+        只做本地状态检查（connection.open标志），不发COM_PING网络往返；
+        连接中途断开由execute_query的重连重试兜底
+        """
+        conn = self.connection
+        # mysqlclient的连接对象没有open属性，存在即视为已连接
+        return conn is not None and bool(getattr(conn, 'open', True))
+
+    def ping(self) -> bool:
+        """
+        显式的网络级存活检查（COM_PING一次往返）
+
+        is_connected只做本地状态判断、不走网络；确实需要确认
+        服务端可达时才调用本方法
+        """
         if self.connection is None:
             return False
+        try:
+            self.connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _reconnect_once(self) -> bool:
+        """连接失效时重连一次，成功返回True"""
         try:
             self.connection.ping(reconnect=True)
             return True
-        except:
+        except Exception:
+            # 驱动可切换(pymysql/mysqlclient)，异常基类不同，统一按失败处理
             return False
 
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        stream: bool = False
+    ):
         """
         执行SQL查询
 
         Args:
             query: SQL查询语句
             params: 查询参数
+            stream: True时使用服务端游标(SSDictCursor)逐批流式返回，
+                    内存占用与结果集大小无关，适合大结果集的一次性遍历
 
         Returns:
-            查询结果列表
+            查询结果列表；stream=True时返回逐行yield的生成器
         """
         if not self.is_connected():
             logger.error("数据库未连接")
+            return iter(()) if stream else []
+
+        if stream:
+            return self._stream_query(query, params)
+
+        try:
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    results = cursor.fetchall()
+            except _RETRYABLE_ERRORS:
+                # 连接可能已被服务端断开：重连一次后重试
+                if not self._reconnect_once():
+                    raise
+                with self.connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    results = cursor.fetchall()
+
+            logger.info(f"✓ 查询成功: {len(results)} 条记录")
+            return results
+
+        except Exception as e:
+            logger.error(f"✗ 查询失败: {e}")
             return []
 
+    def _stream_query(self, query: str, params: Optional[tuple] = None):
+        """以服务端游标流式执行查询，每fetch_size行取一批逐行yield"""
+        cursor = self.connection.cursor(self._ss_cursor)
+        cursor.arraysize = self.fetch_size
         try:
-            with self.connection.cursor() as cursor:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(self.fetch_size)
+                if not rows:
+                    break
+                yield from rows
+        except Exception as e:
+            logger.error(f"✗ 流式查询失败: {e}")
+        finally:
+            cursor.close()
+
+    def fetch_frame(self, query: str, params: Optional[tuple] = None):
+        """
+        直接以DataFrame返回查询结果（列式构建）
+
+        绕过List[Dict]的逐行字典物化：pandas按列构建数组，
+        下游要建DataFrame时比 execute_query + pd.DataFrame(rows) 省约一半解析时间。
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Returns:
+            pd.DataFrame: 查询结果（失败返回空DataFrame）
+        """
+        import pandas as pd
+
+        if not self.is_connected():
+            logger.error("数据库未连接")
+            return pd.DataFrame()
+
+        try:
+            # 元组游标取回全部行后一次性按列构建DataFrame：保持列式意图，
+            # 又不触发pandas对非SQLAlchemy连接的"only supports SQLAlchemy
+            # connectable" UserWarning（read_sql_query对裸DBAPI连接每查必警）
+            with self.connection.cursor(self._tuple_cursor) as cursor:
                 cursor.execute(query, params)
-                results = cursor.fetchall()
-                logger.info(f"✓ 查询成功: {len(results)} 条记录")
-                return results
+                columns = [d[0] for d in cursor.description or ()]
+                df = pd.DataFrame(cursor.fetchall(), columns=columns)
+            logger.info(f"✓ 查询成功: {len(df)} 条记录")
+            return df
 
         except Exception as e:
             logger.error(f"✗ 查询失败: {e}")
+            return pd.DataFrame()
+
+    def execute_many(self, query: str, params_list: List[tuple]) -> List[List[Dict[str, Any]]]:
+        """
+        用同一游标批量执行同一SQL的多组参数
+
+        相比循环调用execute_query，省去每次的游标创建和连接存活检查，
+        适合按渠道/月份循环的参数化查询。
+
+        Args:
+            query: SQL查询语句
+            params_list: 参数元组列表，每组参数执行一次
+
+        Returns:
+            每组参数对应的结果列表
+        """
+        if not self.is_connected():
+            logger.error("数据库未连接")
+            return []
+
+        try:
+            results = []
+            with self.connection.cursor() as cursor:
+                for params in params_list:
+                    cursor.execute(query, params)
+                    results.append(cursor.fetchall())
+            logger.info(f"✓ 批量查询成功: {len(results)} 组参数")
+            return results
+
+        except Exception as e:
+            logger.error(f"✗ 批量查询失败: {e}")
             return []
 
+    def executemany_write(self, query: str, rows: List[tuple]) -> int:
+        """
+        批量执行INSERT/UPDATE写入
+
+        使用pymysql的executemany，INSERT会被折叠为单条多VALUES语句，
+        一次往返写入全部行。
+
+        Args:
+            query: SQL写入语句（含%s占位符）
+            rows: 参数元组列表
+
+        Returns:
+            影响的行数（失败返回0）
+        """
+        if not self.is_connected():
+            logger.error("数据库未连接")
+            return 0
+
+        try:
+            with self.connection.cursor() as cursor:
+                affected = cursor.executemany(query, rows)
+            self.connection.commit()
+            logger.info(f"✓ 批量写入成功: {affected} 行")
+            return affected or 0
+
+        except Exception as e:
+            logger.error(f"✗ 批量写入失败: {e}")
+            try:
+                self.connection.rollback()
+            except Exception as rollback_error:
+                # 连接已断开时rollback本身也会失败，不能让它冲破"失败返回0"的约定
+                logger.warning(f"回滚失败: {rollback_error}")
+            return 0
+
     def close(self):
         """关闭数据库连接"""
         if self.connection:
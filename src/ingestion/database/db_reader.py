@@ -4,12 +4,74 @@
 """
 
 import logging
+import time
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 from .db_connection import DatabaseConnection
 from .query_loader import QueryLoader
+from .result_cache import ResultCache
+
+def _traffic_level_sql(level: int, with_level_col: bool = False) -> str:
+    """
+    构建单个流量源层级的聚合SQL
+
+    with_level_col=True时在SELECT头部附带level辅助列，
+    供UNION ALL合并查询按层级拆分结果
+    """
+    level_col = f"    {level} as level,\n" if with_level_col else ""
+    return f"""SELECT
+{level_col}    YEAR(dtm.date) as year,
+    MONTH(dtm.date) as month,
+    dtm.traffic_source_l{level} as source_name,
+    dtm.channel,
+    dtm.traffic_type,
+    SUM(dtm.uv) as uv,
+    SUM(dtm.buyers) as buyers,
+    ROUND(SUM(dtm.buyers) / NULLIF(SUM(dtm.uv), 0) * 100, 2) as cr,
+    SUM(dtm.gmv) as gmv,
+    SUM(dtm.net) as net
+FROM daily_traffic_metrics dtm
+WHERE dtm.date >= %s AND dtm.date < DATE_ADD(%s, INTERVAL 1 DAY)
+    AND dtm.source_level = {level}
+GROUP BY YEAR(dtm.date), MONTH(dtm.date),
+    dtm.traffic_source_l{level}, dtm.channel, dtm.traffic_type
+HAVING SUM(dtm.uv) > 0"""
+
+
+# SQL在模块加载时构建一次，查询调用路径上不再做Python级字符串拼接
+_TRAFFIC_SQL = {
+    level: _traffic_level_sql(level) + "\nORDER BY year, month, uv DESC"
+    for level in (1, 2, 3)
+}
+
+# 三个层级折叠为单条查询（见read_traffic_sources_all_levels）：
+# 以source_level入GROUP BY、CASE选源名列，daily_traffic_metrics单次扫描
+# 即覆盖全部层级，比逐层UNION ALL少两遍索引扫描
+_TRAFFIC_ALL_SQL = """SELECT
+    dtm.source_level as level,
+    YEAR(dtm.date) as year,
+    MONTH(dtm.date) as month,
+    CASE dtm.source_level
+        WHEN 1 THEN dtm.traffic_source_l1
+        WHEN 2 THEN dtm.traffic_source_l2
+        ELSE dtm.traffic_source_l3
+    END as source_name,
+    dtm.channel,
+    dtm.traffic_type,
+    SUM(dtm.uv) as uv,
+    SUM(dtm.buyers) as buyers,
+    ROUND(SUM(dtm.buyers) / NULLIF(SUM(dtm.uv), 0) * 100, 2) as cr,
+    SUM(dtm.gmv) as gmv,
+    SUM(dtm.net) as net
+FROM daily_traffic_metrics dtm
+WHERE dtm.date >= %s AND dtm.date < DATE_ADD(%s, INTERVAL 1 DAY)
+    AND dtm.source_level IN (1, 2, 3)
+GROUP BY dtm.source_level, YEAR(dtm.date), MONTH(dtm.date),
+    source_name, dtm.channel, dtm.traffic_type
+HAVING SUM(dtm.uv) > 0
+ORDER BY level, year, month, uv DESC"""
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +82,12 @@ class DatabaseReader:
     支持SQL文件查询和直接SQL查询
     """
 
-    def __init__(self, config: Union[int, str, Path, Dict[str, Any]] = 0):
+    def __init__(
+        self,
+        config: Union[int, str, Path, Dict[str, Any]] = 0,
+        fetch_size: int = 1000,
+        result_cache: Union[str, Path, ResultCache, None] = None
+    ):
         """
         初始化数据库读取器
 
@@ -29,6 +96,10 @@ class DatabaseReader:
                 - int: 数据库索引，从默认配置文件读取 (默认0)
                 - dict: 数据库配置字典
                 - str/Path: JSON配置文件路径
+            fetch_size: 流式查询每批取回的行数
+            result_cache: 本地结果缓存。传路径时创建ResultCache，
+                也可直接传入配置好ttl的实例；None表示不缓存。
+                报表对重叠日期范围反复重建时，缓存命中免去重复查询
 
         Example:
             # 使用默认配置文件的第一个数据库
@@ -48,8 +119,15 @@ class DatabaseReader:
             # 从JSON配置文件
             reader = DatabaseReader("/path/to/config.json")
         """
-        self.db = DatabaseConnection(config)
-        self.query_loader = QueryLoader()
+        self.db = DatabaseConnection(config, fetch_size=fetch_size)
+        self.query_loader = QueryLoader.get()
+        if result_cache is not None and not isinstance(result_cache, ResultCache):
+            result_cache = ResultCache(result_cache)
+        self.result_cache = result_cache
+        # test_connection最近一次成功的时刻（monotonic），短TTL内免重复RTT
+        self._conn_verified_ts = 0.0
+        # get_all_table_structures的结果缓存，供get_table_structure直接查表
+        self._table_structures: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
     def is_connected(self) -> bool:
         """检查数据库是否已连接"""
@@ -58,7 +136,8 @@ class DatabaseReader:
     def execute_query(
         self,
         query: str,
-        params: Optional[tuple] = None
+        params: Optional[tuple] = None,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """
         执行SQL查询
@@ -66,26 +145,76 @@ class DatabaseReader:
         Args:
             query: SQL查询语句
             params: 查询参数
+            use_cache: 配置了result_cache时是否启用缓存
+                （需要绕过缓存强制查库时传False）
 
         Returns:
             查询结果列表
         """
+        if self.result_cache is not None and use_cache:
+            key = ResultCache.make_key(query, params)
+            hit = self.result_cache.get(key)
+            if hit is not None:
+                logger.debug("✓ 结果缓存命中")
+                return hit
+
+            results = self.db.execute_query(query, params)
+            if results:
+                self.result_cache.put(key, results)
+            return results
+
         return self.db.execute_query(query, params)
 
+    def execute_query_iter(self, query: str, params: Optional[tuple] = None):
+        """
+        流式执行SQL查询
+
+        使用服务端游标逐行yield，峰值内存与结果集大小无关，
+        适合长日期范围的一次性遍历聚合
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Returns:
+            逐行yield结果字典的生成器
+        """
+        return self.db.execute_query(query, params, stream=True)
+
+    def execute_query_df(self, query: str, params: Optional[tuple] = None):
+        """
+        执行SQL查询并以DataFrame返回（列式构建）
+
+        结果按列存储为numpy数组，26列×数百行的目标表查询
+        比List[Dict]省数倍内存，下游聚合直接走向量化路径
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Returns:
+            pd.DataFrame: 查询结果（失败返回空DataFrame）
+        """
+        return self.db.fetch_frame(query, params)
+
     def execute_sql_file(
         self,
         query_name: str,
-        params: Optional[tuple] = None
-    ) -> List[Dict[str, Any]]:
+        params: Optional[tuple] = None,
+        stream: bool = False,
+        as_frame: bool = False
+    ):
         """
         执行SQL文件中的查询
 
         Args:
             query_name: 查询名称 (不含.sql后缀)
             params: 查询参数
+            stream: True时流式返回生成器（服务端游标）
+            as_frame: True时以DataFrame返回（列式构建，免逐行建字典）
 
         Returns:
-            查询结果列表
+            查询结果列表；stream=True时为生成器；as_frame=True时为DataFrame
 
         Example:
             reader = DatabaseReader("config.yaml")
@@ -94,8 +223,15 @@ class DatabaseReader:
         sql = self.query_loader.load(query_name)
         if not sql:
             logger.error(f"SQL查询加载失败: {query_name}")
-            return []
-
+            if as_frame:
+                import pandas as pd
+                return pd.DataFrame()
+            return iter(()) if stream else []
+
+        if as_frame:
+            return self.execute_query_df(sql, params)
+        if stream:
+            return self.execute_query_iter(sql, params)
         return self.execute_query(sql, params)
 
     # ========== 业务查询方法 ==========
@@ -103,42 +239,113 @@ class DatabaseReader:
     def read_target_metrics(
         self,
         start_date: date,
-        end_date: date
-    ) -> List[Dict[str, Any]]:
+        end_date: date,
+        stream: bool = False,
+        as_frame: bool = False
+    ):
         """
         读取目标表数据 (日度KPI)
 
         Args:
             start_date: 开始日期
             end_date: 结束日期
+            stream: True时流式返回生成器，长日期范围下内存占用恒定
+            as_frame: True时返回列式DataFrame，下游做聚合时
+                      免去逐行字典物化，直接走向量化路径
 
         Returns:
-            日度指标数据列表
+            日度指标数据列表；stream=True时为生成器；as_frame=True时为DataFrame
         """
-        params = (start_date.strftime('%Y-%m-%d'),
-                 end_date.strftime('%Y-%m-%d'))
+        # pymysql原生序列化date对象，无需手动strftime
+        params = (start_date, end_date)
         logger.info(f"读取目标表: {start_date} 至 {end_date}")
-        return self.execute_sql_file('target_metrics', params)
+        return self.execute_sql_file('target_metrics', params,
+                                     stream=stream, as_frame=as_frame)
 
     def read_monthly_summary(
         self,
         start_date: date,
-        end_date: date
-    ) -> List[Dict[str, Any]]:
+        end_date: date,
+        stream: bool = False,
+        as_frame: bool = False,
+        use_materialized: bool = False
+    ):
         """
         读取月度汇总数据
 
         Args:
             start_date: 开始日期
             end_date: 结束日期
+            stream: True时流式返回生成器
+            as_frame: True时返回列式DataFrame
+            use_materialized: True时历史月份读monthly_summary_mv物化表
+                （需DBA按monthly_summary_mv_refresh.sql建表并定时刷新），
+                仅当前未完结月份实时聚合，明细表扫描量缩小约两个数量级
 
         Returns:
-            月度汇总数据列表
+            月度汇总数据列表；stream=True时为生成器；as_frame=True时为DataFrame
         """
-        params = (start_date.strftime('%Y-%m-%d'),
-                 end_date.strftime('%Y-%m-%d'))
         logger.info(f"读取月度汇总: {start_date} 至 {end_date}")
-        return self.execute_sql_file('monthly_summary', params)
+
+        if use_materialized:
+            params = (start_date, start_date, end_date, end_date,
+                      start_date, end_date)
+            return self.execute_sql_file('monthly_summary_mv', params,
+                                         stream=stream, as_frame=as_frame)
+
+        params = (start_date, end_date)
+        return self.execute_sql_file('monthly_summary', params,
+                                     stream=stream, as_frame=as_frame)
+
+    # read_target_totals的汇总列与可用分组维度（白名单，防SQL拼接注入）
+    _TOTALS_SUM_COLS = ('gmv', 'net', 'uv', 'buyers', 'orders',
+                        'paid_traffic', 'free_traffic')
+    _TOTALS_GROUP_EXPRS = {
+        'channel': 'dkm.channel',
+        'year': 'YEAR(dkm.date)',
+        'month': 'MONTH(dkm.date)',
+    }
+
+    def read_target_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        by: Tuple[str, ...] = ('channel',)
+    ) -> List[Dict[str, Any]]:
+        """
+        读取区间内按维度预聚合的核心指标
+
+        聚合下推到SQL：只传回每个分组一行SUM结果，不拉原始日度行
+        回来在Python里再求和，传输量和客户端CPU都小几个数量级。
+        仅看汇总的调用方（如看板）应优先用本方法，需要时间序列时
+        再用read_target_metrics取日度行
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            by: 分组维度，可选 'channel' / 'year' / 'month'
+
+        Returns:
+            每个分组一行的汇总数据列表
+        """
+        group_exprs = []
+        for col in by:
+            expr = self._TOTALS_GROUP_EXPRS.get(col)
+            if expr is None:
+                logger.error(f"✗ 不支持的分组维度: {col!r}")
+                return []
+            group_exprs.append((col, expr))
+
+        select_cols = [f"{expr} as {col}" for col, expr in group_exprs]
+        select_cols += [f"SUM(dkm.{c}) as {c}" for c in self._TOTALS_SUM_COLS]
+        query = (
+            "SELECT\n    " + ",\n    ".join(select_cols) + "\n"
+            "FROM daily_kpi_metrics dkm\n"
+            "WHERE dkm.date >= %s AND dkm.date < DATE_ADD(%s, INTERVAL 1 DAY)\n"
+            "GROUP BY " + ", ".join(expr for _, expr in group_exprs)
+        )
+        logger.info(f"读取汇总指标(按{'/'.join(by)}): {start_date} 至 {end_date}")
+        return self.execute_query(query, (start_date, end_date))
 
     def read_traffic_l1(
         self,
@@ -155,8 +362,7 @@ class DatabaseReader:
         Returns:
             一级流量源数据列表
         """
-        params = (start_date.strftime('%Y-%m-%d'),
-                 end_date.strftime('%Y-%m-%d'))
+        params = (start_date, end_date)
         logger.info(f"读取一级流量源: {start_date} 至 {end_date}")
         return self.execute_sql_file('traffic_l1', params)
 
@@ -175,91 +381,135 @@ class DatabaseReader:
         Returns:
             二级流量源数据列表
         """
-        # 使用内联SQL，因为queries目录可能没有traffic_l2.sql
-        query = """
-        SELECT
-            YEAR(dtm.date) as year,
-            MONTH(dtm.date) as month,
-            dtm.traffic_source_l2 as source_name,
-            dtm.channel,
-            dtm.traffic_type,
-            SUM(dtm.uv) as uv,
-            SUM(dtm.buyers) as buyers,
-            ROUND(SUM(dtm.buyers) / NULLIF(SUM(dtm.uv), 0) * 100, 2) as cr,
-            SUM(dtm.gmv) as gmv,
-            SUM(dtm.net) as net
-        FROM daily_traffic_metrics dtm
-        WHERE DATE(dtm.date) BETWEEN %s AND %s
-            AND dtm.source_level = 2
-        GROUP BY YEAR(dtm.date), MONTH(dtm.date),
-                 dtm.traffic_source_l2, dtm.channel, dtm.traffic_type
-        ORDER BY year, month, SUM(dtm.uv) DESC
-        """
-        params = (start_date.strftime('%Y-%m-%d'),
-                 end_date.strftime('%Y-%m-%d'))
+        params = (start_date, end_date)
         logger.info(f"读取二级流量源: {start_date} 至 {end_date}")
-        return self.execute_query(query, params)
+        return self.execute_query(_TRAFFIC_SQL[2], params)
 
     def read_traffic_l3(
         self,
         start_date: date,
-        end_date: date
+        end_date: date,
+        top_n: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         读取三级流量源数据
 
+        三级流量源长尾严重；top_n限定每月按UV排名的前N个来源，
+        长尾行在服务端即被裁掉，不再占用传输带宽
+
         Args:
             start_date: 开始日期
             end_date: 结束日期
+            top_n: 每月保留的流量源数量上限（None返回全部）
 
         Returns:
             三级流量源数据列表
         """
-        query = """
-        SELECT
-            YEAR(dtm.date) as year,
-            MONTH(dtm.date) as month,
-            dtm.traffic_source_l3 as source_name,
-            dtm.channel,
-            dtm.traffic_type,
-            SUM(dtm.uv) as uv,
-            SUM(dtm.buyers) as buyers,
-            ROUND(SUM(dtm.buyers) / NULLIF(SUM(dtm.uv), 0) * 100, 2) as cr,
-            SUM(dtm.gmv) as gmv,
-            SUM(dtm.net) as net
-        FROM daily_traffic_metrics dtm
-        WHERE DATE(dtm.date) BETWEEN %s AND %s
-            AND dtm.source_level = 3
-        GROUP BY YEAR(dtm.date), MONTH(dtm.date),
-                 dtm.traffic_source_l3, dtm.channel, dtm.traffic_type
-        ORDER BY year, month, SUM(dtm.uv) DESC
-        """
-        params = (start_date.strftime('%Y-%m-%d'),
-                 end_date.strftime('%Y-%m-%d'))
         logger.info(f"读取三级流量源: {start_date} 至 {end_date}")
-        return self.execute_query(query, params)
 
-    def read_all_sources(
+        if top_n is None:
+            return self.execute_query(_TRAFFIC_SQL[3], (start_date, end_date))
+
+        query = (
+            "SELECT year, month, source_name, channel, traffic_type,\n"
+            "    uv, buyers, cr, gmv, net\n"
+            "FROM (\n"
+            "    SELECT t.*,\n"
+            "        ROW_NUMBER() OVER (PARTITION BY t.year, t.month\n"
+            "                           ORDER BY t.uv DESC) AS rn\n"
+            "    FROM (\n" + _traffic_level_sql(3) + "\n    ) t\n"
+            ") ranked\n"
+            "WHERE rn <= %s\n"
+            "ORDER BY year, month, uv DESC"
+        )
+        return self.execute_query(query, (start_date, end_date, top_n))
+
+    def read_traffic_sources_all_levels(
         self,
         start_date: date,
         end_date: date
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        一次往返读取全部三级流量源数据
+
+        单条查询按source_level分组聚合全部层级：
+        daily_traffic_metrics只扫一遍，省去两次网络往返
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            字典, key为流量源层级(1/2/3), value为该层级的数据列表
+        """
+        logger.info(f"读取全部流量源(单次往返): {start_date} 至 {end_date}")
+        rows = self.execute_query(_TRAFFIC_ALL_SQL, (start_date, end_date))
+
+        # 按level拆分，剔除辅助列保持与单层查询相同的行结构
+        by_level: Dict[int, List[Dict[str, Any]]] = {1: [], 2: [], 3: []}
+        for row in rows:
+            level = row.pop('level', None)
+            if level in by_level:
+                by_level[level].append(row)
+        return by_level
+
+    # read_all_sources中独立并发执行的数据源（流量源三层已折叠为单查询）
+    _ALL_SOURCES = ('target_metrics', 'monthly_summary', 'traffic_all')
+
+    def read_all_sources(
+        self,
+        start_date: date,
+        end_date: date,
+        parallel: bool = True
     ) -> Dict[str, Any]:
         """
         读取所有数据源
 
+        三层流量源折叠为一条UNION ALL查询；parallel=True时
+        三个查询并发执行（网络等待重叠，总耗时趋近最慢的单个查询），
+        每个工作线程独立借用连接；parallel=False时单连接顺序执行
+
         Args:
             start_date: 开始日期
             end_date: 结束日期
+            parallel: 是否并发执行各查询
 
         Returns:
             所有数据的字典
         """
+        def _method_for(reader: 'DatabaseReader', name: str):
+            if name == 'traffic_all':
+                return reader.read_traffic_sources_all_levels
+            return getattr(reader, f'read_{name}')
+
+        if parallel and self.db.config:
+            from concurrent.futures import ThreadPoolExecutor
+
+            def _read(name: str):
+                # pymysql连接非线程安全，每个线程用自己的连接
+                # （连接池可用时这里只是借用，开销很小）
+                worker = DatabaseReader(self.db.config)
+                try:
+                    return _method_for(worker, name)(start_date, end_date)
+                finally:
+                    worker.close()
+
+            with ThreadPoolExecutor(max_workers=len(self._ALL_SOURCES)) as executor:
+                futures = {name: executor.submit(_read, name)
+                           for name in self._ALL_SOURCES}
+                raw = {name: future.result()
+                       for name, future in futures.items()}
+        else:
+            raw = {name: _method_for(self, name)(start_date, end_date)
+                   for name in self._ALL_SOURCES}
+
+        traffic = raw.pop('traffic_all')
         result = {
-            'target_metrics': self.read_target_metrics(start_date, end_date),
-            'monthly_summary': self.read_monthly_summary(start_date, end_date),
-            'traffic_l1': self.read_traffic_l1(start_date, end_date),
-            'traffic_l2': self.read_traffic_l2(start_date, end_date),
-            'traffic_l3': self.read_traffic_l3(start_date, end_date),
+            'target_metrics': raw['target_metrics'],
+            'monthly_summary': raw['monthly_summary'],
+            'traffic_l1': traffic[1],
+            'traffic_l2': traffic[2],
+            'traffic_l3': traffic[3],
         }
 
         total_records = sum(len(v) if isinstance(v, list) else 0 for v in result.values())
@@ -269,16 +519,29 @@ class DatabaseReader:
 
     # ========== 实用方法 ==========
 
+    # test_connection成功结果的缓存时长（秒）
+    _CONN_TEST_TTL = 1.0
+
     def test_connection(self) -> bool:
-        """测试数据库连接"""
+        """
+        测试数据库连接
+
+        成功结果在短TTL内缓存：紧跟在一次成功测试后的重复调用
+        直接返回True，不再发SELECT 1的网络往返
+        """
         if not self.is_connected():
             return False
 
+        if time.monotonic() - self._conn_verified_ts < self._CONN_TEST_TTL:
+            return True
+
         try:
-            result = self.execute_query("SELECT 1 as test")
-            if result and result[0].get('test') == 1:
-                logger.info("✓ 数据库连接测试成功")
-                return True
+            with self.db.connection.cursor(self.db._tuple_cursor) as cursor:
+                cursor.execute("SELECT 1")
+                if cursor.fetchone()[0] == 1:
+                    self._conn_verified_ts = time.monotonic()
+                    logger.info("✓ 数据库连接测试成功")
+                    return True
         except Exception as e:
             logger.error(f"✗ 连接测试失败: {e}")
 
@@ -290,34 +553,87 @@ class DatabaseReader:
             return []
 
         try:
-            results = self.execute_query("SHOW TABLES")
-            tables = [list(row.values())[0] for row in results]
+            # 元组游标直接取r[0]，省掉每行的values()视图+list拷贝
+            with self.db.connection.cursor(self.db._tuple_cursor) as cursor:
+                cursor.execute("SHOW TABLES")
+                tables = [r[0] for r in cursor.fetchall()]
             logger.info(f"✓ 找到 {len(tables)} 张表")
             return tables
         except Exception as e:
             logger.error(f"✗ 获取表列表失败: {e}")
             return []
 
+    def get_all_table_structures(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        一次查询获取当前库所有表的结构
+
+        单条information_schema查询替代对每张表各发一次DESCRIBE，
+        N次往返降为1次
+
+        Returns:
+            字典, key为表名, value为该表的字段信息列表
+            （字段dict与DESCRIBE同形: Field/Type/Null/Key/Default/Extra）
+        """
+        if not self.is_connected():
+            return {}
+
+        database = (self.db.config or {}).get('database')
+        if not database:
+            logger.error("配置中缺少database，无法查询表结构")
+            return {}
+
+        # 列名对齐DESCRIBE的输出形状，调用方无需感知数据源差异
+        query = """
+        SELECT
+            TABLE_NAME,
+            COLUMN_NAME AS `Field`,
+            COLUMN_TYPE AS `Type`,
+            IS_NULLABLE AS `Null`,
+            COLUMN_KEY AS `Key`,
+            COLUMN_DEFAULT AS `Default`,
+            EXTRA AS `Extra`
+        FROM information_schema.columns
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+        try:
+            rows = self.execute_query(query, (database,))
+            structures: Dict[str, List[Dict[str, Any]]] = {}
+            for row in rows:
+                structures.setdefault(row.pop('TABLE_NAME'), []).append(row)
+            logger.info(f"✓ 获取 {len(structures)} 张表的结构")
+            self._table_structures = structures
+            return structures
+        except Exception as e:
+            logger.error(f"✗ 获取表结构失败: {e}")
+            return {}
+
     def get_table_structure(self, table_name: str) -> List[Dict[str, Any]]:
         """
         获取表结构
 
+        首次调用通过get_all_table_structures一次性拉取整库结构并缓存，
+        之后全部走本地字典查找，不再对每张表单发DESCRIBE
+
         Args:
             table_name: 表名
 
         Returns:
             字段信息列表
         """
-        if not self.is_connected():
-            return []
-
-        try:
-            results = self.execute_query(f"DESCRIBE {table_name}")
+        if self._table_structures is None:
+            if not self.is_connected():
+                return []
+            self.get_all_table_structures()
+            if self._table_structures is None:
+                return []
+
+        results = self._table_structures.get(table_name, [])
+        if results:
             logger.info(f"✓ 表 {table_name} 有 {len(results)} 个字段")
-            return results
-        except Exception as e:
-            logger.error(f"✗ 获取表结构失败: {e}")
-            return []
+        else:
+            logger.warning(f"✗ 当前库中不存在表: {table_name}")
+        return results
 
     def close(self):
         """关闭数据库连接"""
@@ -27,7 +27,9 @@ SELECT
     SUM(dkm.dtc_organic_net) as dtc_organic_net,
     SUM(dkm.dtc_organic_gmv) as dtc_organic_gmv
 FROM daily_kpi_metrics dkm
-WHERE DATE(dkm.date) BETWEEN %s AND %s
+-- date列上可走索引的范围谓词（不要包DATE()，否则逐行求值无法用索引）
+-- 建议索引: CREATE INDEX idx_date_channel ON daily_kpi_metrics(date, channel)
+WHERE dkm.date >= %s AND dkm.date < DATE_ADD(%s, INTERVAL 1 DAY)
     AND dkm.channel IN ('PFS', 'DTC', 'TOTAL')
 GROUP BY YEAR(dkm.date), MONTH(dkm.date), dkm.channel
 ORDER BY year, month, channel;
@@ -0,0 +1,54 @@
+-- 月度汇总查询 (物化表版)
+-- 说明: 历史月份读monthly_summary_mv(见monthly_summary_mv_refresh.sql),
+--       当前未完结月份实时聚合daily_kpi_metrics, 两段UNION ALL合并。
+--       已完结月份的汇总不可变, 物化表比明细表小约两个数量级。
+
+SELECT
+    year, month, channel,
+    gmv, net, uv, buyers, orders, paid_traffic, free_traffic,
+    cancel_amount, return_amount,
+    dtc_social_net, dtc_social_gmv, dtc_ff_net, dtc_ff_gmv,
+    dtc_ad_net, dtc_ad_gmv, dtc_organic_net, dtc_organic_gmv
+FROM monthly_summary_mv
+WHERE (year, month) >= (YEAR(%s), MONTH(%s))
+    AND (year, month) <= (YEAR(%s), MONTH(%s))
+    -- 当前月份交给下方的实时聚合
+    AND (year < YEAR(CURDATE())
+         OR (year = YEAR(CURDATE()) AND month < MONTH(CURDATE())))
+
+UNION ALL
+
+SELECT
+    YEAR(dkm.date) as year,
+    MONTH(dkm.date) as month,
+    dkm.channel,
+    SUM(dkm.gmv) as gmv,
+    SUM(dkm.net) as net,
+    SUM(dkm.uv) as uv,
+    SUM(dkm.buyers) as buyers,
+    SUM(dkm.orders) as orders,
+    SUM(dkm.paid_traffic) as paid_traffic,
+    SUM(dkm.free_traffic) as free_traffic,
+    SUM(dkm.cancel_amount) as cancel_amount,
+    SUM(dkm.return_amount) as return_amount,
+    SUM(dkm.dtc_social_net) as dtc_social_net,
+    SUM(dkm.dtc_social_gmv) as dtc_social_gmv,
+    SUM(dkm.dtc_ff_net) as dtc_ff_net,
+    SUM(dkm.dtc_ff_gmv) as dtc_ff_gmv,
+    SUM(dkm.dtc_ad_net) as dtc_ad_net,
+    SUM(dkm.dtc_ad_gmv) as dtc_ad_gmv,
+    SUM(dkm.dtc_organic_net) as dtc_organic_net,
+    SUM(dkm.dtc_organic_gmv) as dtc_organic_gmv
+FROM daily_kpi_metrics dkm
+-- 只有查询区间覆盖当前月时这一段才会产出行
+WHERE dkm.date >= GREATEST(DATE_FORMAT(CURDATE(), '%%Y-%%m-01'), %s)
+    AND dkm.date < DATE_ADD(%s, INTERVAL 1 DAY)
+    AND dkm.channel IN ('PFS', 'DTC', 'TOTAL')
+GROUP BY YEAR(dkm.date), MONTH(dkm.date), dkm.channel
+
+ORDER BY year, month, channel;
+
+-- 参数 (共6个, 均为日期):
+--   1-2. start_date, start_date
+--   3-4. end_date, end_date
+--   5-6. start_date, end_date
@@ -18,10 +18,13 @@ SELECT
     SUM(dtm.gmv) / NULLIF(SUM(dtm.orders), 0) as aov,
     SUM(dtm.gmv) / NULLIF(SUM(dtm.buyers), 0) as atv
 FROM daily_traffic_metrics dtm
-WHERE DATE(dtm.date) BETWEEN %s AND %s
+-- date列上可走索引的范围谓词（不要包DATE()，否则逐行求值无法用索引）
+WHERE dtm.date >= %s AND dtm.date < DATE_ADD(%s, INTERVAL 1 DAY)
     AND dtm.source_level = 1
 GROUP BY YEAR(dtm.date), MONTH(dtm.date),
          dtm.traffic_source_l1, dtm.channel, dtm.traffic_type
+-- 与合并查询(read_traffic_sources_all_levels)一致: 过滤零UV分组
+HAVING SUM(dtm.uv) > 0
 ORDER BY year, month, SUM(dtm.uv) DESC;
 
 -- 参数:
@@ -3,34 +3,97 @@ SQL查询加载器
 从queries目录统一管理SQL查询
 """
 
+import functools
 import logging
+import mmap
+import threading
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _read_sql_text(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    进程级SQL文本缓存，按(路径, mtime_ns, 大小)为键
+
+    mmap零拷贝读入后一次性解码；每个DatabaseReader各持有自己的
+    QueryLoader实例（如read_all_sources的并发工作线程），
+    进程级缓存让同一SQL文件全程只读盘解码一次
+    """
+    if size == 0:
+        return ""
+    with open(path_str, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode('utf-8')
+
+
+# 按目录共享的QueryLoader实例（见QueryLoader.get）
+_loaders = {}
+_loaders_lock = threading.Lock()
+
+
 class QueryLoader:
     """
     SQL查询加载器
     从queries目录加载.sql文件
     """
 
-    def __init__(self, queries_dir: Optional[Path] = None):
+    @classmethod
+    def get(cls, queries_dir: Optional[Path] = None) -> 'QueryLoader':
+        """
+        获取按目录共享的加载器实例
+
+        每个DatabaseReader不再各自构造QueryLoader重复扫描目录：
+        同一queries_dir全进程共享一个实例，构造后的reader创建
+        完全不触碰文件系统
+
+        Args:
+            queries_dir: SQL文件目录，默认使用本模块的queries目录
+
+        Returns:
+            共享的QueryLoader实例
+        """
+        key = Path(queries_dir) if queries_dir is not None \
+            else Path(__file__).parent / "queries"
+        with _loaders_lock:
+            loader = _loaders.get(key)
+            if loader is None:
+                loader = cls(key)
+                _loaders[key] = loader
+            return loader
+
+    def __init__(
+        self,
+        queries_dir: Optional[Path] = None,
+        reload_on_change: bool = False
+    ):
         """
         初始化查询加载器
 
         Args:
             queries_dir: SQL文件目录，默认使用本模块的queries目录
+            reload_on_change: True时每次load都stat文件，内容变化即重读；
+                默认False，构造时一次性预载后不再触碰文件系统
         """
         if queries_dir is None:
             queries_dir = Path(__file__).parent / "queries"
 
         self.queries_dir = Path(queries_dir)
+        self.reload_on_change = reload_on_change
         self._cache = {}
 
         if not self.queries_dir.exists():
             logger.warning(f"SQL查询目录不存在: {self.queries_dir}")
+            return
+
+        # 一次目录扫描预载全部SQL：后续load零文件系统调用，
+        # 实际读盘解码由进程级的_read_sql_text缓存跨实例共享
+        for sql_file in self.queries_dir.glob("*.sql"):
+            st = sql_file.stat()
+            self._cache[sql_file.stem] = _read_sql_text(
+                str(sql_file), st.st_mtime_ns, st.st_size)
 
     def load(self, query_name: str) -> str:
         """
@@ -46,20 +109,22 @@ class QueryLoader:
             loader = QueryLoader()
             sql = loader.load('target_metrics')
         """
-        # 检查缓存
-        if query_name in self._cache:
+        # 检查缓存（默认不回查文件系统）
+        if query_name in self._cache and not self.reload_on_change:
             return self._cache[query_name]
 
-        # 构建文件路径
+        # 缓存未命中（构造后新增的文件）或要求校验mtime时走文件系统
         sql_file = self.queries_dir / f"{query_name}.sql"
 
-        if not sql_file.exists():
+        try:
+            st = sql_file.stat()
+        except FileNotFoundError:
             logger.error(f"SQL文件不存在: {sql_file}")
             return ""
 
         try:
-            with open(sql_file, 'r', encoding='utf-8') as f:
-                sql = f.read()
+            # mtime未变时命中进程级缓存，不重复读盘
+            sql = _read_sql_text(str(sql_file), st.st_mtime_ns, st.st_size)
 
             # 缓存查询
             self._cache[query_name] = sql
@@ -89,11 +154,5 @@ class QueryLoader:
         self._cache.clear()
 
     def list_queries(self) -> list:
-        """列出所有可用的SQL查询"""
-        if not self.queries_dir.exists():
-            return []
-
-        return [
-            f.stem for f in self.queries_dir.glob("*.sql")
-            if f.is_file()
-        ]
+        """列出所有可用的SQL查询（来自构造时的预载缓存，不再扫描目录）"""
+        return sorted(self._cache.keys())
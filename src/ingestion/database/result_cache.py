@@ -0,0 +1,96 @@
+"""
+查询结果本地缓存
+以SQLite为存储，按查询文本+参数的哈希为键
+"""
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    持久化的查询结果缓存
+
+    MBR报表常针对重叠的日期范围反复重建，每次都对数据库重跑
+    相同的聚合查询。缓存命中时直接从本地SQLite反序列化结果
+    （微秒级），不再走网络查询（秒级）。
+
+    以pickle存储结果，date/Decimal等类型原样往返，
+    命中结果与直接查询完全一致。
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None):
+        """
+        初始化结果缓存
+
+        Args:
+            path: SQLite缓存文件路径（目录不存在时自动创建）
+            ttl: 缓存有效期（秒），None表示永不过期。
+                 已结束月份的聚合不会再变，适合长期缓存；
+                 覆盖当前月的查询建议设置较短ttl
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_cache ("
+            "key TEXT PRIMARY KEY, created REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, params: Optional[tuple] = None) -> str:
+        """由查询文本和参数生成缓存键"""
+        return hashlib.sha256((query + repr(params)).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """读取缓存项，未命中或已过期返回None"""
+        row = self._conn.execute(
+            "SELECT created, data FROM query_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        created, data = row
+        if self.ttl is not None and time.time() - created > self.ttl:
+            self.delete(key)
+            return None
+
+        try:
+            return pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"缓存项反序列化失败，按未命中处理: {e}")
+            self.delete(key)
+            return None
+
+    def put(self, key: str, value: Any):
+        """写入缓存项（同键覆盖）"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO query_cache VALUES (?, ?, ?)",
+            (key, time.time(),
+             pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+        self._conn.commit()
+
+    def delete(self, key: str):
+        """删除单个缓存项"""
+        self._conn.execute("DELETE FROM query_cache WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def clear(self):
+        """清空全部缓存"""
+        self._conn.execute("DELETE FROM query_cache")
+        self._conn.commit()
+        logger.info("查询结果缓存已清空")
+
+    def close(self):
+        """关闭缓存连接"""
+        self._conn.close()
@@ -3,11 +3,17 @@ Excel数据读取器
 读取MBR Excel模板文件并解析为统一数据模型
 """
 
-import pandas as pd
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+import asyncio
 import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import pandas as pd
 
 from ..models.data_schema import (
     UnifiedReportData,
@@ -24,6 +30,29 @@ from ..models.data_schema import (
 
 logger = logging.getLogger(__name__)
 
+# calamine(Rust实现)可用时用其解析xlsx，比openpyxl的XML树遍历快数倍；
+# 未安装时engine=None走pandas默认
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
+
+def _read_sheet(file_path: str, sheet_name: str) -> pd.DataFrame:
+    """读取单个工作表（供子进程调用，每个进程独立打开文件）"""
+    return pd.read_excel(file_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
+
+
+def _nonempty(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    过滤全空行
+
+    布尔掩码索引替代dropna(how='all')：后者总是整帧拷贝全部列，
+    掩码索引在解析这种读一遍即弃的场景下省一次完整分配
+    """
+    return df[df.notna().any(axis=1)]
+
 
 class ExcelDataReader:
     """
@@ -61,23 +90,38 @@ class ExcelDataReader:
     def _load_excel(self):
         """加载Excel文件"""
         try:
-            self.excel_file = pd.ExcelFile(self.file_path)
+            self.excel_file = pd.ExcelFile(self.file_path, engine=_EXCEL_ENGINE)
             logger.info(f"Loaded Excel file: {self.file_path}")
             logger.info(f"Available sheets: {self.excel_file.sheet_names}")
         except Exception as e:
             raise ValueError(f"Failed to load Excel file: {e}")
 
-    def read_all_sheets(self) -> Dict[str, pd.DataFrame]:
+    def read_all_sheets(self, parallel: bool = True) -> Dict[str, pd.DataFrame]:
         """
         读取所有工作表
 
+        xlsx解析是CPU密集型（XML树遍历），各工作表相互独立，
+        parallel=True时用进程池并行解析，多核机器上接近线性加速
+
+        Args:
+            parallel: 是否并行读取各工作表
+
         Returns:
             字典, key为sheet名称, value为DataFrame
         """
         if not self.excel_file:
             self._load_excel()
 
-        for sheet_name in self.excel_file.sheet_names:
+        sheet_names = self.excel_file.sheet_names
+
+        if parallel and len(sheet_names) > 1:
+            try:
+                return self._read_sheets_parallel(sheet_names)
+            except Exception as e:
+                # 子进程不可用（如受限环境）时回退顺序读取
+                logger.warning(f"并行读取失败，回退顺序读取: {e}")
+
+        for sheet_name in sheet_names:
             try:
                 df = pd.read_excel(self.excel_file, sheet_name=sheet_name)
                 self.sheet_data[sheet_name] = df
@@ -88,6 +132,62 @@ class ExcelDataReader:
 
         return self.sheet_data
 
+    def _read_sheets_parallel(self, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """进程池并行读取工作表，每个子进程独立打开文件解析"""
+        max_workers = min(os.cpu_count() or 1, len(sheet_names))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_read_sheet, str(self.file_path), name): name
+                for name in sheet_names
+            }
+            for future in as_completed(futures):
+                sheet_name = futures[future]
+                try:
+                    df = future.result()
+                    self.sheet_data[sheet_name] = df
+                    logger.debug(f"Read sheet '{sheet_name}': {df.shape}")
+                except (BrokenProcessPool, RuntimeError):
+                    # 进程池级故障（如spawn环境缺__main__保护、worker被杀）：
+                    # 并非单表解析错误，抛出让read_all_sheets走顺序回退，
+                    # 否则所有sheet都会被静默置空
+                    raise
+                except Exception as e:
+                    logger.warning(f"Failed to read sheet '{sheet_name}': {e}")
+                    self.sheet_data[sheet_name] = pd.DataFrame()
+
+        return self.sheet_data
+
+    def _get_sheet(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """
+        按需读取单个工作表并缓存
+
+        只解压解析被请求的sheet：parse_all实际只消费约1/3的工作表，
+        未用到的（如买家画像对比）完全不做XML解析、不占内存
+
+        Args:
+            sheet_name: 工作表名称
+
+        Returns:
+            DataFrame；工作表不存在时返回None
+        """
+        if sheet_name in self.sheet_data:
+            return self.sheet_data[sheet_name]
+
+        if not self.excel_file:
+            self._load_excel()
+
+        if sheet_name not in self.excel_file.sheet_names:
+            return None
+
+        try:
+            df = pd.read_excel(self.excel_file, sheet_name=sheet_name)
+        except Exception as e:
+            logger.warning(f"Failed to read sheet '{sheet_name}': {e}")
+            df = pd.DataFrame()
+
+        self.sheet_data[sheet_name] = df
+        return df
+
     def parse_target_table(self) -> List[TargetMetric]:
         """
         解析目标表工作表
@@ -95,14 +195,13 @@ class ExcelDataReader:
         Returns:
             TargetMetric对象列表
         """
-        if '目标表' not in self.sheet_data:
+        df = self._get_sheet('目标表')
+        if df is None:
             logger.warning("Sheet '目标表' not found")
             return []
 
-        df = self.sheet_data['目标表']
-
-        # 清洗数据
-        df = df.dropna(how='all')  # 删除全空行
+        # 清洗数据: 删除全空行
+        df = _nonempty(df)
 
         if df.empty:
             logger.warning("Sheet '目标表' is empty")
@@ -120,63 +219,70 @@ class ExcelDataReader:
         """
         解析Campaign工作表
 
+        列级向量化解析：日期、数值各做一次整列转换，
+        替代逐行iterrows + 逐格pd.to_datetime的解释器循环
+
         Returns:
             CampaignEvent对象列表
         """
-        if 'Campaign' not in self.sheet_data:
+        df = self._get_sheet('Campaign')
+        if df is None:
             return []
 
-        df = self.sheet_data['Campaign']
-        df = df.dropna(how='all')
+        df = _nonempty(df)
 
-        campaigns = []
-        for _, row in df.iterrows():
-            try:
-                # 提取活动名称
-                campaign_name = row.get('Campaign', row.get('campaign', ''))
-                if not campaign_name or pd.isna(campaign_name):
-                    continue
+        if df.empty:
+            return []
 
-                # 提取日期 (可能在不同列)
-                start_date = None
-                end_date = None
-
-                # 尝试从多个可能的列名提取日期
-                date_cols = ['Start Date', 'start_date', 'Date', 'date']
-                for col in date_cols:
-                    if col in row and pd.notna(row[col]):
-                        try:
-                            start_date = pd.to_datetime(row[col]).date()
-                            break
-                        except:
-                            pass
-
-                # 如果找不到明确的日期列,使用索引
-                if not start_date:
-                    for col in df.columns:
-                        if pd.notna(row[col]):
-                            try:
-                                date_val = pd.to_datetime(row[col])
-                                if hasattr(date_val, 'date'):
-                                    start_date = date_val.date()
-                                    break
-                            except:
-                                continue
-
-                if not start_date:
-                    continue
+        def _coalesce(columns: List[str]) -> pd.Series:
+            """按优先级取第一个非空值（整列操作）"""
+            present = [c for c in columns if c in df.columns]
+            if not present:
+                return pd.Series(pd.NA, index=df.index)
+            return df[present].bfill(axis=1).iloc[:, 0]
+
+        names = _coalesce(['Campaign', 'campaign'])
+
+        # 日期：先试明确的日期列，一次整列to_datetime
+        start_dates = pd.to_datetime(
+            _coalesce(['Start Date', 'start_date', 'Date', 'date']),
+            errors='coerce')
+
+        # 仍缺日期的行按列顺序补齐（与原逐行扫描语义一致）。
+        # 任意列都会被试着当日期解析，屏蔽pandas逐列发出的
+        # "Could not infer format"噪声（coerce语义本就预期解析失败）
+        if start_dates.isna().any():
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                for col in df.columns:
+                    if col in ('Campaign', 'campaign'):
+                        continue
+                    if not start_dates.isna().any():
+                        break
+                    start_dates = start_dates.fillna(
+                        pd.to_datetime(df[col], errors='coerce'))
+
+        gmv = pd.to_numeric(_coalesce(['GMV', 'gmv']), errors='coerce')
+        net = pd.to_numeric(_coalesce(['NET', 'net']), errors='coerce')
+        uv = pd.to_numeric(_coalesce(['UV', 'uv']), errors='coerce')
+        buyers = pd.to_numeric(_coalesce(['Buyers', 'buyers']), errors='coerce')
 
-                # 创建活动对象
-                campaign = CampaignEvent(
-                    campaign_name=str(campaign_name),
-                    start_date=start_date,
-                    end_date=end_date or start_date,  # 默认当天
-                    gmv=row.get('GMV', row.get('gmv')) if pd.notna(row.get('GMV', row.get('gmv'))) else None,
-                    net=row.get('NET', row.get('net')) if pd.notna(row.get('NET', row.get('net'))) else None,
-                    uv=int(row.get('UV', row.get('uv', 0))) if pd.notna(row.get('UV', row.get('uv'))) else None,
-                    buyers=int(row.get('Buyers', row.get('buyers', 0))) if pd.notna(row.get('Buyers', row.get('buyers'))) else None,
-                )
-                campaigns.append(campaign)
+        valid = names.notna() & names.astype(str).ne('') & start_dates.notna()
+
+        campaigns = []
+        rows = zip(names[valid], start_dates[valid], gmv[valid],
+                   net[valid], uv[valid], buyers[valid])
+        for name, start, g, n, u, b in rows:
+            try:
+                campaigns.append(CampaignEvent(
+                    campaign_name=str(name),
+                    start_date=start.date(),
+                    end_date=start.date(),  # 默认当天
+                    gmv=float(g) if pd.notna(g) else None,
+                    net=float(n) if pd.notna(n) else None,
+                    uv=int(u) if pd.notna(u) else None,
+                    buyers=int(b) if pd.notna(b) else None,
+                ))
             except Exception as e:
                 logger.debug(f"Failed to parse campaign row: {e}")
                 continue
@@ -188,6 +294,9 @@ class ExcelDataReader:
         """
         解析流量源工作表 (一级、二级、三级)
 
+        列名解析在循环外做一次；数值列整列转换后批量构建对象，
+        不再在每行内重扫df.columns
+
         Returns:
             字典, key为channel, value为TrafficMetrics列表
         """
@@ -195,61 +304,67 @@ class ExcelDataReader:
 
         # 检查各级流量源工作表
         traffic_sheets = {
-            '一级': '一级流量源',
-            '二级': '二级流量源',
-            '三级': '三级流量源'
+            1: '一级流量源',
+            2: '二级流量源',
+            3: '三级流量源'
         }
 
-        for level_name, sheet_name in traffic_sheets.items():
-            if sheet_name not in self.sheet_data:
+        for level, sheet_name in traffic_sheets.items():
+            df = self._get_sheet(sheet_name)
+            if df is None:
                 continue
 
-            df = self.sheet_data[sheet_name]
-            df = df.dropna(how='all')
+            df = _nonempty(df)
 
             if df.empty:
                 continue
 
-            # 提取流量源数据
-            for _, row in df.iterrows():
-                try:
-                    # 获取流量源名称
-                    source_name_col = None
-                    for col in df.columns:
-                        if 'source' in col.lower() or 'name' in col.lower() or '流量源' in col:
-                            source_name_col = col
-                            break
-
-                    if not source_name_col:
-                        continue
-
-                    source_name = row.get(source_name_col)
-                    if pd.isna(source_name):
-                        continue
+            # 流量源名称列只解析一次（原实现每行都重扫全部列名）
+            source_name_col = next(
+                (c for c in df.columns
+                 if 'source' in str(c).lower() or 'name' in str(c).lower()
+                 or '流量源' in str(c)),
+                None)
+            if source_name_col is None:
+                continue
 
-                    # 创建TrafficMetrics对象
-                    level = int(level_name.replace('级', ''))
+            df = df[df[source_name_col].notna()]
+            if df.empty:
+                continue
 
-                    metric = TrafficMetrics(
-                        source_name=str(source_name),
+            def _numeric(columns: List[str]) -> pd.Series:
+                present = [c for c in columns if c in df.columns]
+                if not present:
+                    return pd.Series(pd.NA, index=df.index)
+                return pd.to_numeric(
+                    df[present].bfill(axis=1).iloc[:, 0], errors='coerce')
+
+            uv = _numeric(['UV', 'uv'])
+            buyers = _numeric(['Buyers', 'buyers'])
+            gmv = _numeric(['GMV', 'gmv'])
+            net = _numeric(['NET', 'net'])
+
+            metrics = []
+            rows = zip(df[source_name_col], uv, buyers, gmv, net)
+            for name, u, b, g, n in rows:
+                try:
+                    metrics.append(TrafficMetrics(
+                        source_name=str(name),
                         source_level=level,
                         traffic_type='unknown',  # 需要根据数据推断
-                        uv=int(row.get('UV', 0)) if pd.notna(row.get('UV')) else None,
-                        buyers=int(row.get('Buyers', 0)) if pd.notna(row.get('Buyers')) else None,
-                        gmv=row.get('GMV', row.get('gmv')) if pd.notna(row.get('GMV', row.get('gmv'))) else None,
-                        net=row.get('NET', row.get('net')) if pd.notna(row.get('NET', row.get('net'))) else None,
-                    )
-
-                    # 按渠道分组 (这里简化处理,实际需要根据数据结构调整)
-                    channel_key = 'TOTAL'
-                    if channel_key not in traffic_data:
-                        traffic_data[channel_key] = []
-                    traffic_data[channel_key].append(metric)
-
+                        uv=int(u) if pd.notna(u) else None,
+                        buyers=int(b) if pd.notna(b) else None,
+                        gmv=float(g) if pd.notna(g) else None,
+                        net=float(n) if pd.notna(n) else None,
+                    ))
                 except Exception as e:
                     logger.debug(f"Failed to parse traffic row: {e}")
                     continue
 
+            # 按渠道分组 (这里简化处理,实际需要根据数据结构调整)
+            if metrics:
+                traffic_data.setdefault('TOTAL', []).extend(metrics)
+
         logger.info(f"Parsed traffic data for {len(traffic_data)} channels")
         return traffic_data
 
@@ -260,10 +375,9 @@ class ExcelDataReader:
         Returns:
             SalesOverview对象或None
         """
-        if 'SalesOverview' not in self.sheet_data:
+        df = self._get_sheet('SalesOverview')
+        if df is None:
             return None
-
-        df = self.sheet_data['SalesOverview']
         # SalesOverview结构较复杂,这里简化处理
         # 实际需要根据具体数据结构调整
 
@@ -279,11 +393,11 @@ class ExcelDataReader:
         Returns:
             CompetitorTraffic列表或None
         """
-        if '竞店流量summary' not in self.sheet_data:
+        df = self._get_sheet('竞店流量summary')
+        if df is None:
             return None
 
-        df = self.sheet_data['竞店流量summary']
-        df = df.dropna(how='all')
+        df = _nonempty(df)
 
         if df.empty:
             return None
@@ -301,10 +415,9 @@ class ExcelDataReader:
         Returns:
             MemberData对象或None
         """
-        if 'fans&member' not in self.sheet_data:
+        df = self._get_sheet('fans&member')
+        if df is None:
             return None
-
-        df = self.sheet_data['fans&member']
         # 解析会员数据逻辑...
         # 需要根据实际数据结构调整
 
@@ -319,9 +432,7 @@ class ExcelDataReader:
         """
         logger.info("Starting to parse all sheets from Excel")
 
-        # 确保所有sheet已读取
-        if not self.sheet_data:
-            self.read_all_sheets()
+        # 各parse_*方法按需懒加载所需工作表，未消费的sheet不会被解析
 
         # 解析各个工作表
         target_metrics = self.parse_target_table()
@@ -333,10 +444,13 @@ class ExcelDataReader:
 
         # 提取报告期间 (从目标表推断)
         report_period = "2025-12"  # 默认值
+        latest_date = None
         if target_metrics:
             # 使用最后一个日期的年月
             last_metric = target_metrics[-1]
             report_period = f"{last_metric.date.year}-{last_metric.date.month:02d}"
+            # 预计算最新日期，下游按期间聚合时O(1)读取
+            latest_date = max(m.date for m in target_metrics)
 
         # 创建统一数据对象
         report_data = UnifiedReportData(
@@ -347,7 +461,8 @@ class ExcelDataReader:
             sales_overview=sales_overview,
             competitor_data=competitor_data,
             member_data=member_data,
-            monthly_metrics=[]  # 将由transformation模块填充
+            monthly_metrics=[],  # 将由transformation模块填充
+            latest_date=latest_date
         )
 
         logger.info(f"Parsed complete report data for period: {report_period}")
@@ -357,6 +472,19 @@ class ExcelDataReader:
 
         return report_data
 
+    async def parse_all_async(self) -> UnifiedReportData:
+        """
+        在工作线程中执行parse_all，不阻塞事件循环
+
+        Excel解析是纯CPU工作，耗时可达秒级；异步编排方可用
+        asyncio.gather让它与数据库查询的网络等待重叠，
+        总耗时趋近两者中较慢的一个
+
+        Returns:
+            UnifiedReportData对象
+        """
+        return await asyncio.to_thread(self.parse_all)
+
 
 def read_excel_template(file_path: Path) -> UnifiedReportData:
     """
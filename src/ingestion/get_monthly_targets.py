@@ -6,7 +6,11 @@
 """
 
 import logging
+import os
+import threading
+import time
 from datetime import date
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 import pandas as pd
@@ -15,6 +19,199 @@ from .database import DatabaseReader
 
 logger = logging.getLogger(__name__)
 
+# calamine(Rust实现)可用时用其解析xlsx，比openpyxl的XML树遍历快数倍；
+# 未安装时engine=None走pandas默认
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
+# pyarrow可用时用其多线程列式CSV解析器，比默认C解析器快数倍；
+# 未安装时engine=None走pandas默认
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = None
+
+# 参与TOTAL/DTC_EXCL_FF算术的数值列（顺序即衍生行的输出列顺序）
+_NUMERIC_COLS = ['gmv', 'net', 'net_units', 'gmv_units', 'uv', 'buyers',
+                 'free_traffic', 'paid_traffic']
+# FF目标参与扣减的列：月度只扣gmv/net/uv，YTD连units/buyers一起扣
+_FF_SUB_COLS_MONTHLY = ['gmv', 'net', 'uv']
+_FF_SUB_COLS_YTD = ['gmv', 'net', 'net_units', 'gmv_units', 'uv', 'buyers']
+
+
+def _ff_vector(ff: Optional[Dict[str, Any]], sub_cols: List[str]) -> pd.Series:
+    """FF行对齐到数值列的扣减向量，缺失列和不参与扣减的列填0"""
+    if ff is None:
+        return pd.Series(0, index=_NUMERIC_COLS)
+    return (pd.Series(ff).reindex(sub_cols, fill_value=0)
+            .reindex(_NUMERIC_COLS, fill_value=0))
+
+
+# YTD聚合SQL，模块加载时构建一次；pymysql走文本协议，
+# 没有服务端预编译语句可缓存，这里能省掉的是每次调用的字符串重建
+# 参数：year, month, start_date, end_date
+_YTD_SQL = """
+SELECT
+    %s as year,
+    %s as month,
+    channel,
+    SUM(gmv) as gmv,
+    SUM(net) as net,
+    SUM(net_units) as net_units,
+    SUM(gmv_units) as gmv_units,
+    SUM(uv) as uv,
+    SUM(buyers) as buyers,
+    SUM(free_traffic) as free_traffic,
+    SUM(paid_traffic) as paid_traffic,
+    SUM(dtc_social_net) as dtc_social_net,
+    SUM(dtc_social_gmv) as dtc_social_gmv,
+    SUM(dtc_social_traffic) as dtc_social_traffic,
+    SUM(dtc_organic_net) as dtc_organic_net,
+    SUM(dtc_organic_gmv) as dtc_organic_gmv,
+    SUM(dtc_organic_traffic) as dtc_organic_traffic,
+    COUNT(DISTINCT Date) as days
+FROM dunhill_pfs_target
+WHERE Date BETWEEN %s AND %s
+GROUP BY channel
+ORDER BY channel;
+"""
+
+# 按配置复用的DatabaseReader，月度与YTD共享同一条已认证连接，
+# 免去每次调用的建连/握手开销
+_reader_pool: Dict[Any, DatabaseReader] = {}
+_reader_pool_lock = threading.Lock()
+
+
+def _get_reader(
+    db_config: Union[int, str, Path, Dict[str, Any]]
+) -> DatabaseReader:
+    """返回该配置下缓存的读取器，首次调用时创建"""
+    if isinstance(db_config, dict):
+        key = tuple(sorted(db_config.items()))
+    else:
+        key = str(db_config)
+
+    with _reader_pool_lock:
+        reader = _reader_pool.get(key)
+        if reader is None:
+            reader = DatabaseReader(db_config)
+            # 连接失败的读取器不入池：下次调用重建，DB恢复后立即可用，
+            # 避免一次瞬时故障把该配置永久钉死在失败状态
+            if reader.is_connected():
+                _reader_pool[key] = reader
+        return reader
+
+
+def close_all_readers():
+    """关闭全部缓存的数据库读取器（进程退出前调用）"""
+    with _reader_pool_lock:
+        for reader in _reader_pool.values():
+            reader.close()
+        _reader_pool.clear()
+
+
+# DB目标读取结果缓存：报表生成常对同一(year, month)反复取数，
+# 目标表日内只追加，短TTL内直接复用上次结果，省掉DB往返
+_targets_cache: Dict[Any, Tuple[float, pd.DataFrame]] = {}
+_targets_cache_lock = threading.Lock()
+_TARGETS_CACHE_TTL = 300.0  # 秒
+
+
+def _cached_targets(func):
+    """按(函数, year, month, db_config)缓存DB读取结果，返回防御性拷贝"""
+    @wraps(func)
+    def wrapper(year, month, db_config=1):
+        key = (func.__name__, year, month, repr(db_config))
+        now = time.monotonic()
+
+        with _targets_cache_lock:
+            hit = _targets_cache.get(key)
+            if hit is not None and now - hit[0] < _TARGETS_CACHE_TTL:
+                return hit[1].copy()
+
+        df = func(year, month, db_config)
+        if df is not None:
+            with _targets_cache_lock:
+                _targets_cache[key] = (now, df.copy())
+        return df
+    return wrapper
+
+
+def invalidate_targets_cache():
+    """清空目标数据缓存（目标表被改写后调用）"""
+    with _targets_cache_lock:
+        _targets_cache.clear()
+
+
+@lru_cache(maxsize=8)
+def _load_ff_sheet(path: str, mtime: float) -> Optional[pd.DataFrame]:
+    """
+    读取并标准化FF目标表
+
+    按(路径, mtime)缓存：一次报表通常月度和YTD背靠背各读一次同一文件，
+    多月回填更是读N次，Excel解析只做一次即可。文件被修改后mtime变化，
+    缓存自然失效
+
+    Returns:
+        列名已标准化的DataFrame；Excel中找不到目标工作表时返回None
+    """
+    if path.endswith('.csv'):
+        # 读取CSV文件
+        df = pd.read_csv(path, engine=_CSV_ENGINE)
+    else:
+        # 读取Excel文件
+        excel_file = pd.ExcelFile(path, engine=_EXCEL_ENGINE)
+
+        # 查找包含FF目标的工作表
+        sheet_name = None
+        for name in excel_file.sheet_names:
+            if '目标' in name or 'target' in name.lower():
+                sheet_name = name
+                break
+
+        if not sheet_name:
+            logger.info(f"Excel中未找到目标相关工作表，可用: {excel_file.sheet_names}")
+            return None
+
+        # 读取工作表
+        df = pd.read_excel(path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
+
+    # 标准化列名（支持中英文列名）
+    column_map = {
+        '年份': 'year',
+        '月份': 'month',
+        '渠道': 'channel',
+        'year': 'year',
+        'month': 'month',
+        'channel': 'channel'
+    }
+    df = df.rename(columns=column_map)
+
+    # 指标列统一收敛为float64：Excel偶发的字符串/空格会把列留成
+    # object dtype，下游.sum()退化成Python逐元素循环；
+    # 先coerce（非法值记0）让聚合走NumPy向量路径
+    for col in ('gmv', 'net', 'net_units', 'gmv_units', 'uv', 'buyers'):
+        if col in df.columns:
+            df[col] = (pd.to_numeric(df[col], errors='coerce')
+                       .fillna(0).astype('float64'))
+    return df
+
+
+# 各月天数查表；二月按闰年规则修正。
+# 省掉热路径上的import calendar和monthrange调用
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day(year: int, month: int) -> int:
+    """返回该月最后一天的日号"""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
 
 def _get_fy_start_date(current_year: int, current_month: int) -> date:
     """
@@ -80,6 +277,7 @@ def get_monthly_targets(
     return df_final
 
 
+@_cached_targets
 def _read_monthly_from_db(
     year: int,
     month: int,
@@ -87,26 +285,20 @@ def _read_monthly_from_db(
 ) -> Optional[pd.DataFrame]:
     """从数据库读取月度汇总目标"""
     try:
-        reader = DatabaseReader(db_config)
+        reader = _get_reader(db_config)
 
         if not reader.is_connected():
             logger.error("数据库连接失败")
             return None
 
         # 计算月份范围
-        import calendar
-        _, last_day = calendar.monthrange(year, month)
         start_date = date(year, month, 1)
-        end_date = date(year, month, last_day)
+        end_date = date(year, month, _last_day(year, month))
 
-        # 执行月度汇总SQL
-        params = (
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        )
+        # 执行月度汇总SQL（pymysql原生序列化date对象，无需strftime）
+        params = (start_date, end_date)
 
         data = reader.execute_sql_file('monthly_target_summary', params)
-        reader.close()
 
         if not data:
             return None
@@ -136,42 +328,13 @@ def _read_ff_from_excel(
         return None
 
     try:
-        # 判断文件类型并读取
-        if excel_path.endswith('.csv'):
-            # 读取CSV文件
-            df = pd.read_csv(excel_path)
-        else:
-            # 读取Excel文件
-            excel_file = pd.ExcelFile(excel_path)
-
-            # 查找包含FF目标的工作表
-            sheet_name = None
-            for name in excel_file.sheet_names:
-                if '目标' in name or 'target' in name.lower():
-                    sheet_name = name
-                    break
-
-            if not sheet_name:
-                logger.info(f"Excel中未找到目标相关工作表，可用: {excel_file.sheet_names}")
-                return None
-
-            # 读取工作表
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
-
-        # 查找FF数据（支持中英文列名）
-        # 标准化列名映射
-        column_map = {
-            '年份': 'year',
-            '月份': 'month',
-            '渠道': 'channel',
-            'year': 'year',
-            'month': 'month',
-            'channel': 'channel'
-        }
-
-        # 重命名列名为标准格式
-        df_standardized = df.rename(columns=column_map)
+        # 读取并标准化（按路径+mtime缓存，与YTD共享一次解析）
+        df_standardized = _load_ff_sheet(excel_path,
+                                         os.path.getmtime(excel_path))
+        if df_standardized is None:
+            return None
 
+        # 查找FF数据
         df_ff = df_standardized[
             (df_standardized['year'] == year) &
             (df_standardized['month'] == month) &
@@ -240,59 +403,47 @@ def _merge_and_calculate(
         - DTC_EXCL_FF (计算得出)
         - TOTAL (计算得出)
     """
-    # 1. 合并数据库和FF数据
+    # 1. 收集基础行（数据库 + FF），全程在行列表上追加，
+    #    最后一次性建DataFrame，避免逐行pd.concat反复整帧拷贝
+    rows = df_db.to_dict('records')
     if df_ff is not None and not df_ff.empty:
-        df_merged = pd.concat([df_db, df_ff], ignore_index=True)
-    else:
-        df_merged = df_db.copy()
+        rows.extend(df_ff.to_dict('records'))
 
-    # 2. 计算DTC_EXCL_FF
-    if 'DTC' in df_merged['channel'].values:
-        dtc = df_merged[df_merged['channel'] == 'DTC'].iloc[0]
+    # 渠道 -> 行dict索引，O(1)查找替代每渠道一次的整列布尔掩码扫描
+    rec = {r['channel']: r for r in rows}
+    pfs = rec.get('PFS')
+    dtc = rec.get('DTC')
+    ff = rec.get('DTC_FF')
 
-        dtc_excl_ff = {
+    # 2. 计算DTC_EXCL_FF：数值列一次向量减法，替代逐列Python算术
+    if dtc is not None:
+        dtc_vec = pd.Series(dtc).reindex(_NUMERIC_COLS, fill_value=0)
+        excl_vec = dtc_vec - _ff_vector(ff, _FF_SUB_COLS_MONTHLY)
+
+        rows.append({
             'year': dtc['year'],
             'month': dtc['month'],
             'channel': 'DTC_EXCL_FF',
-            'gmv': dtc['gmv'] - (df_ff.iloc[0]['gmv'] if df_ff is not None else 0),
-            'net': dtc['net'] - (df_ff.iloc[0]['net'] if df_ff is not None else 0),
-            'net_units': dtc['net_units'],
-            'gmv_units': dtc['gmv_units'],
-            'uv': dtc['uv'] - (df_ff.iloc[0]['uv'] if df_ff is not None else 0),
-            'buyers': dtc['buyers'],
-            'free_traffic': dtc['free_traffic'],
-            'paid_traffic': dtc['paid_traffic'],
+            **excl_vec.to_dict(),
             'days': dtc['days'],
             'source': 'calculated'
-        }
+        })
 
-        df_merged = pd.concat([df_merged, pd.DataFrame([dtc_excl_ff])], ignore_index=True)
+    # 3. 计算TOTAL (PFS + DTC)：同样一次向量加法
+    if pfs is not None and dtc is not None:
+        total_vec = pd.Series(pfs).reindex(_NUMERIC_COLS, fill_value=0) + dtc_vec
 
-    # 3. 计算TOTAL (PFS + DTC)
-    if 'PFS' in df_merged['channel'].values and 'DTC' in df_merged['channel'].values:
-        pfs = df_merged[df_merged['channel'] == 'PFS'].iloc[0]
-        dtc = df_merged[df_merged['channel'] == 'DTC'].iloc[0]
-
-        total = {
+        rows.append({
             'year': pfs['year'],
             'month': pfs['month'],
             'channel': 'TOTAL',
-            'gmv': pfs['gmv'] + dtc['gmv'],
-            'net': pfs['net'] + dtc['net'],
-            'net_units': pfs['net_units'] + dtc['net_units'],
-            'gmv_units': pfs['gmv_units'] + dtc['gmv_units'],
-            'uv': pfs['uv'] + dtc['uv'],
-            'buyers': pfs['buyers'] + dtc['buyers'],
-            'free_traffic': pfs['free_traffic'] + dtc['free_traffic'],
-            'paid_traffic': pfs['paid_traffic'] + dtc['paid_traffic'],
+            **total_vec.to_dict(),
             'days': max(pfs['days'], dtc['days']),
             'source': 'calculated'
-        }
-
-        df_merged = pd.concat([df_merged, pd.DataFrame([total])], ignore_index=True)
+        })
 
-    # 4. 排序
-    df_merged = df_merged.sort_values(['channel'])
+    # 4. 一次性物化并排序
+    df_merged = pd.DataFrame(rows).sort_values(['channel'])
 
     logger.info(f"月度目标合并完成，渠道: {list(df_merged['channel'].values)}")
     return df_merged
@@ -322,13 +473,8 @@ def get_monthly_targets_dict(
     if df is None:
         return {}
 
-    # 转换为字典格式
-    result = {}
-    for _, row in df.iterrows():
-        channel = row['channel']
-        result[channel] = row.to_dict()
-
-    return result
+    # 转换为字典格式：一次C层转换，替代iterrows的逐行Series分配
+    return df.set_index('channel', drop=False).to_dict(orient='index')
 
 
 # ==================== YTD目标读取功能 ====================
@@ -380,6 +526,7 @@ def get_ytd_targets(
     return df_final
 
 
+@_cached_targets
 def _read_ytd_from_db(
     year: int,
     month: int,
@@ -391,7 +538,7 @@ def _read_ytd_from_db(
     YTD = 从财年4月到指定月份的累计
     """
     try:
-        reader = DatabaseReader(db_config)
+        reader = _get_reader(db_config)
 
         if not reader.is_connected():
             logger.error("数据库连接失败")
@@ -400,49 +547,15 @@ def _read_ytd_from_db(
         # 计算YTD日期范围
         fy_start_date = _get_fy_start_date(year, month)
 
-        import calendar
-        _, last_day = calendar.monthrange(year, month)
-        end_date = date(year, month, last_day)
+        end_date = date(year, month, _last_day(year, month))
 
         # 查询YTD数据（不GROUP BY，直接汇总所有数据）
-        params = (
-            fy_start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        )
-
-        # 执行SQL - 需要一个能返回原始数据然后按channel聚合的查询
-        # 这里我们直接构建SQL进行聚合
-        sql = """
-        SELECT
-            %s as year,
-            %s as month,
-            channel,
-            SUM(gmv) as gmv,
-            SUM(net) as net,
-            SUM(net_units) as net_units,
-            SUM(gmv_units) as gmv_units,
-            SUM(uv) as uv,
-            SUM(buyers) as buyers,
-            SUM(free_traffic) as free_traffic,
-            SUM(paid_traffic) as paid_traffic,
-            SUM(dtc_social_net) as dtc_social_net,
-            SUM(dtc_social_gmv) as dtc_social_gmv,
-            SUM(dtc_social_traffic) as dtc_social_traffic,
-            SUM(dtc_organic_net) as dtc_organic_net,
-            SUM(dtc_organic_gmv) as dtc_organic_gmv,
-            SUM(dtc_organic_traffic) as dtc_organic_traffic,
-            COUNT(DISTINCT Date) as days
-        FROM dunhill_pfs_target
-        WHERE Date BETWEEN %s AND %s
-        GROUP BY channel
-        ORDER BY channel;
-        """
+        params = (fy_start_date, end_date)
 
         # 参数：year, month, start_date, end_date
         query_params = (year, month) + params
 
-        data = reader.execute_query(sql, query_params)
-        reader.close()
+        data = reader.execute_query(_YTD_SQL, query_params)
 
         if not data:
             return None
@@ -476,85 +589,33 @@ def _read_ytd_ff_from_excel(
         return None
 
     try:
-        # 判断文件类型并读取
-        if excel_path.endswith('.csv'):
-            # 读取CSV文件
-            df = pd.read_csv(excel_path)
-        else:
-            # 读取Excel文件
-            excel_file = pd.ExcelFile(excel_path)
-
-            # 查找包含FF目标的工作表
-            sheet_name = None
-            for name in excel_file.sheet_names:
-                if '目标' in name or 'target' in name.lower():
-                    sheet_name = name
-                    break
-
-            if not sheet_name:
-                logger.info(f"Excel中未找到目标相关工作表")
-                return None
-
-            # 读取工作表
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
+        # 读取并标准化（按路径+mtime缓存，与月度共享一次解析）
+        df_standardized = _load_ff_sheet(excel_path,
+                                         os.path.getmtime(excel_path))
+        if df_standardized is None:
+            return None
 
         # 确定YTD的月份范围
         fy_start_date = _get_fy_start_date(year, month)
 
-        # 构建需要读取的月份列表
-        months_to_sum = []
-        current_year = fy_start_date.year
-        current_month = fy_start_date.month
-
-        # 从财年开始月到目标月的所有月份
-        while True:
-            if current_year == year and current_month > month:
-                break
-
-            months_to_sum.append((current_year, current_month))
-
-            # 移动到下一个月
-            if current_month == 12:
-                current_year += 1
-                current_month = 1
-            else:
-                current_month += 1
-
-            # 如果已经超过目标年月，退出
-            if current_year > year or (current_year == year and current_month > month):
-                break
-
-        # 筛选并累加FF数据（支持中英文列名）
-        # 标准化列名映射
-        column_map = {
-            '年份': 'year',
-            '月份': 'month',
-            '渠道': 'channel',
-            'year': 'year',
-            'month': 'month',
-            'channel': 'channel'
-        }
-
-        # 重命名列名为标准格式
-        df_standardized = df.rename(columns=column_map)
-
-        df_ff_list = []
-        for yr, mth in months_to_sum:
-            df_filtered = df_standardized[
-                (df_standardized['year'] == yr) &
-                (df_standardized['month'] == mth) &
-                (df_standardized['channel'].isin(['FF', 'DTC_FF']))
-            ]
-            if not df_filtered.empty:
-                df_ff_list.append(df_filtered)
-
-        if not df_ff_list:
+        # 从财年开始月到目标月的所有月份：
+        # 月序号(year*12+month-1)算术一步生成，免逐月滚动的分支逻辑
+        base = fy_start_date.year * 12 + fy_start_date.month - 1
+        n_months = year * 12 + month - 1 - base + 1
+        months_to_sum = [((base + i) // 12, (base + i) % 12 + 1)
+                         for i in range(n_months)]
+
+        # 筛选FF数据：(year, month)键整体一次isin命中全部月份，
+        # 替代逐月布尔掩码扫描+concat
+        month_keys = pd.MultiIndex.from_frame(df_standardized[['year', 'month']])
+        mask = (month_keys.isin(months_to_sum)
+                & df_standardized['channel'].isin(['FF', 'DTC_FF']).values)
+        df_ff_all = df_standardized[mask]
+
+        if df_ff_all.empty:
             logger.info(f"Excel中没有 {fy_start_date} 到 {year}年{month}月 的FF目标")
             return None
 
-        # 合并所有月份的FF数据
-        df_ff_all = pd.concat(df_ff_list, ignore_index=True)
-
         # 累加所有指标
         ff_summary = {
             'year': year,
@@ -599,59 +660,47 @@ def _merge_and_calculate_ytd(
     Returns:
         完整的YTD目标DataFrame
     """
-    # 1. 合并数据库和FF数据
+    # 1. 收集基础行（数据库 + FF），全程在行列表上追加，
+    #    最后一次性建DataFrame，避免逐行pd.concat反复整帧拷贝
+    rows = df_db.to_dict('records')
     if df_ff is not None and not df_ff.empty:
-        df_merged = pd.concat([df_db, df_ff], ignore_index=True)
-    else:
-        df_merged = df_db.copy()
+        rows.extend(df_ff.to_dict('records'))
+
+    # 渠道 -> 行dict索引，O(1)查找替代每渠道一次的整列布尔掩码扫描
+    rec = {r['channel']: r for r in rows}
+    pfs = rec.get('PFS')
+    dtc = rec.get('DTC')
+    ff = rec.get('DTC_FF')
 
-    # 2. 计算DTC_EXCL_FF (YTD)
-    if 'DTC' in df_merged['channel'].values:
-        dtc = df_merged[df_merged['channel'] == 'DTC'].iloc[0]
+    # 2. 计算DTC_EXCL_FF (YTD)：数值列一次向量减法，替代逐列Python算术
+    if dtc is not None:
+        dtc_vec = pd.Series(dtc).reindex(_NUMERIC_COLS, fill_value=0)
+        excl_vec = dtc_vec - _ff_vector(ff, _FF_SUB_COLS_YTD)
 
-        dtc_excl_ff = {
+        rows.append({
             'year': dtc['year'],
             'month': dtc['month'],
             'channel': 'DTC_EXCL_FF',
-            'gmv': dtc['gmv'] - (df_ff.iloc[0]['gmv'] if df_ff is not None else 0),
-            'net': dtc['net'] - (df_ff.iloc[0]['net'] if df_ff is not None else 0),
-            'net_units': dtc['net_units'] - (df_ff.iloc[0]['net_units'] if df_ff is not None and 'net_units' in df_ff.iloc[0] else 0),
-            'gmv_units': dtc['gmv_units'] - (df_ff.iloc[0]['gmv_units'] if df_ff is not None and 'gmv_units' in df_ff.iloc[0] else 0),
-            'uv': dtc['uv'] - (df_ff.iloc[0]['uv'] if df_ff is not None else 0),
-            'buyers': dtc['buyers'] - (df_ff.iloc[0]['buyers'] if df_ff is not None and 'buyers' in df_ff.iloc[0] else 0),
-            'free_traffic': dtc['free_traffic'],
-            'paid_traffic': dtc['paid_traffic'],
+            **excl_vec.to_dict(),
             'days': dtc['days'],
             'source': 'calculated'
-        }
-
-        df_merged = pd.concat([df_merged, pd.DataFrame([dtc_excl_ff])], ignore_index=True)
+        })
 
-    # 3. 计算TOTAL (YTD)
-    if 'PFS' in df_merged['channel'].values and 'DTC' in df_merged['channel'].values:
-        pfs = df_merged[df_merged['channel'] == 'PFS'].iloc[0]
-        dtc = df_merged[df_merged['channel'] == 'DTC'].iloc[0]
+    # 3. 计算TOTAL (YTD)：同样一次向量加法
+    if pfs is not None and dtc is not None:
+        total_vec = pd.Series(pfs).reindex(_NUMERIC_COLS, fill_value=0) + dtc_vec
 
-        total = {
+        rows.append({
             'year': pfs['year'],
             'month': pfs['month'],
             'channel': 'TOTAL',
-            'gmv': pfs['gmv'] + dtc['gmv'],
-            'net': pfs['net'] + dtc['net'],
-            'net_units': pfs['net_units'] + dtc['net_units'],
-            'gmv_units': pfs['gmv_units'] + dtc['gmv_units'],
-            'uv': pfs['uv'] + dtc['uv'],
-            'buyers': pfs['buyers'] + dtc['buyers'],
-            'free_traffic': pfs['free_traffic'] + dtc['free_traffic'],
-            'paid_traffic': pfs['paid_traffic'] + dtc['paid_traffic'],
+            **total_vec.to_dict(),
             'days': max(pfs['days'], dtc['days']),
             'source': 'calculated'
-        }
-
-        df_merged = pd.concat([df_merged, pd.DataFrame([total])], ignore_index=True)
+        })
 
-    # 4. 排序
-    df_merged = df_merged.sort_values(['channel'])
+    # 4. 一次性物化并排序
+    df_merged = pd.DataFrame(rows).sort_values(['channel'])
 
     logger.info(f"YTD目标合并完成，渠道: {list(df_merged['channel'].values)}")
     return df_merged
@@ -680,10 +729,5 @@ def get_ytd_targets_dict(
     if df is None:
         return {}
 
-    # 转换为字典格式
-    result = {}
-    for _, row in df.iterrows():
-        channel = row['channel']
-        result[channel] = row.to_dict()
-
-    return result
+    # 转换为字典格式：一次C层转换，替代iterrows的逐行Series分配
+    return df.set_index('channel', drop=False).to_dict(orient='index')
@@ -7,8 +7,11 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import date, datetime
 from enum import Enum
+import logging
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 
 class FiscalYear:
     """
@@ -487,6 +490,12 @@ class UnifiedReportData(BaseModel):
     monthly_metrics: List[MonthlyMetrics] = Field(default_factory=list)
     campaigns: List[CampaignEvent] = Field(default_factory=list)
 
+    # 日度数据中的最新日期 (摄取时预计算，免去下游O(N)扫描)
+    latest_date: Optional[date] = Field(
+        default=None,
+        description="target_metrics中的最大日期"
+    )
+
     # 流量数据 (按渠道和层级组织)
     traffic_sources: Dict[str, List[TrafficMetrics]] = Field(
         default_factory=dict,
@@ -560,6 +569,7 @@ def dataframe_to_target_metrics(df: pd.DataFrame) -> List[TargetMetric]:
         TargetMetric对象列表
     """
     metrics = []
+    skipped = []
 
     for _, row in df.iterrows():
         try:
@@ -607,8 +617,10 @@ def dataframe_to_target_metrics(df: pd.DataFrame) -> List[TargetMetric]:
             )
             metrics.append(metric)
         except Exception as e:
-            # 跳过无效行,继续处理
-            print(f"Warning: Failed to parse row: {e}")
+            # 跳过无效行,继续处理（收集后统一告警，避免逐行print的stdout锁+flush）
+            skipped.append(str(e))
             continue
 
+    if skipped:
+        logger.warning("跳过 %d 条无效行: %s", len(skipped), '; '.join(skipped[:5]))
     return metrics
@@ -260,6 +260,14 @@ class DataAggregator:
         self.daily_metrics = daily_metrics
         self.df = pd.DataFrame([m.dict() for m in daily_metrics])
 
+        # 按(年,月)缓存各渠道的数据切片
+        # 同一月份的多次聚合（PFS/DTC/剔除变体）共享一次过滤+groupby
+        self._month_channel_cache: Dict[tuple, Dict[str, pd.DataFrame]] = {}
+
+        # 按(年,月,渠道)缓存FF/SC剔除总额
+        # DTC_EXCL_FF与DTC_EXCL_FF_SC共用同一份FF总额，免去重复列求和
+        self._exclusion_totals_cache: Dict[tuple, Dict[str, tuple]] = {}
+
         if not self.df.empty:
             # 转换日期列
             if 'date' in self.df.columns:
@@ -267,6 +275,63 @@ class DataAggregator:
                 self.df['year'] = self.df['date'].dt.year
                 self.df['month'] = self.df['date'].dt.month
 
+    def _get_month_channels(self, year: int, month: int) -> Dict[str, pd.DataFrame]:
+        """
+        获取指定月份按渠道分组的数据切片 (带缓存)
+
+        单次布尔过滤 + 单次groupby替代每个渠道各自全表扫描,
+        同月多渠道聚合时只扫描一遍日度数据
+
+        Args:
+            year: 年份
+            month: 月份 (1-12)
+
+        Returns:
+            字典, key为渠道字符串, value为该渠道当月的DataFrame
+        """
+        key = (year, month)
+        cached = self._month_channel_cache.get(key)
+        if cached is None:
+            month_df = self.df[
+                (self.df['year'] == year) &
+                (self.df['month'] == month)
+            ]
+            cached = {channel: group for channel, group in month_df.groupby('channel')}
+            self._month_channel_cache[key] = cached
+        return cached
+
+    def _get_exclusion_totals(
+        self,
+        year: int,
+        month: int,
+        channel_str: str,
+        kind: str,
+        monthly_df: pd.DataFrame
+    ) -> tuple:
+        """
+        获取指定月份的FF/SC剔除总额 (带缓存)
+
+        kind为'ff'或'sc'。DTC_EXCL_FF和DTC_EXCL_FF_SC两个变体
+        对同一月份各自求和FF列，缓存后第二次聚合直接复用
+
+        Returns:
+            (net总额, gmv总额) 元组
+        """
+        key = (year, month, channel_str)
+        per_month = self._exclusion_totals_cache.setdefault(key, {})
+        totals = per_month.get(kind)
+        if totals is None:
+            net_col, gmv_col = {
+                'ff': ('dtc_ff_net', 'dtc_ff_gmv'),
+                'sc': ('dtc_social_net', 'dtc_social_gmv'),
+            }[kind]
+            totals = (
+                monthly_df[net_col].fillna(0).sum(),
+                monthly_df[gmv_col].fillna(0).sum(),
+            )
+            per_month[kind] = totals
+        return totals
+
     def aggregate_monthly(
         self,
         year: int,
@@ -287,15 +352,11 @@ class DataAggregator:
         if self.df.empty:
             return None
 
-        # 过滤数据
+        # 从按月缓存的渠道分组中取数据
         channel_str = channel.value if isinstance(channel, ChannelType) else channel
-        monthly_df = self.df[
-            (self.df['year'] == year) &
-            (self.df['month'] == month) &
-            (self.df['channel'] == channel_str)
-        ].copy()  # 添加.copy()避免SettingWithCopyWarning
+        monthly_df = self._get_month_channels(year, month).get(channel_str)
 
-        if monthly_df.empty:
+        if monthly_df is None or monthly_df.empty:
             logger.warning(f"No data found for {year}-{month:02d} {channel}")
             return None
 
@@ -606,18 +667,17 @@ class DataAggregator:
         if self.df.empty:
             return None
 
-        # 过滤数据
+        # 从按月缓存的渠道分组中取数据
         channel_str = channel.value if isinstance(channel, ChannelType) else channel
-        monthly_df = self.df[
-            (self.df['year'] == year) &
-            (self.df['month'] == month) &
-            (self.df['channel'] == channel_str)
-        ].copy()  # 添加.copy()避免SettingWithCopyWarning
+        monthly_df = self._get_month_channels(year, month).get(channel_str)
 
-        if monthly_df.empty:
+        if monthly_df is None or monthly_df.empty:
             logger.warning(f"No data found for {year}-{month:02d} {channel}")
             return None
 
+        # 后续剔除逻辑会修改net/gmv列，复制以免污染缓存切片
+        monthly_df = monthly_df.copy()
+
         # === 应用渠道剔除逻辑 (仅对DTC渠道有效) ===
         if channel == ChannelType.DTC and (exclude_ff or exclude_social):
             # 计算需要剔除的销售数据
@@ -628,13 +688,15 @@ class DataAggregator:
 
             # 剔除FF (员工福利)
             if exclude_ff:
-                total_ff_net = monthly_df['dtc_ff_net'].fillna(0).sum()
-                total_ff_gmv = monthly_df['dtc_ff_gmv'].fillna(0).sum()
+                total_ff_net, total_ff_gmv = self._get_exclusion_totals(
+                    year, month, channel_str, 'ff', monthly_df
+                )
 
             # 剔除SC (Social社群推广)
             if exclude_social:
-                total_sc_net = monthly_df['dtc_social_net'].fillna(0).sum()
-                total_sc_gmv = monthly_df['dtc_social_gmv'].fillna(0).sum()
+                total_sc_net, total_sc_gmv = self._get_exclusion_totals(
+                    year, month, channel_str, 'sc', monthly_df
+                )
 
             # 应用剔除（只影响销售数据，不影响UV和buyers）
             if total_ff_net > 0 or total_sc_net > 0: